@@ -15,6 +15,7 @@ DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:eLv4hJt8A3Urye67
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_ENV = os.getenv("PINECONE_ENV")
 PINECONE_INDEX = os.getenv("PINECONE_INDEX", "headline-articles")
+PINECONE_ASSUME_INDEX_EXISTS = os.getenv("PINECONE_ASSUME_INDEX_EXISTS", "false").lower() in ("true", "1", "yes", "y")  # skip list_indexes on startup
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
 # API settings
@@ -24,9 +25,12 @@ API_HOST = os.getenv("API_HOST", "0.0.0.0")
 # Worker settings
 WORKER_POLL_INTERVAL = int(os.getenv("WORKER_POLL_INTERVAL", "2"))  # seconds
 MAX_CONCURRENT_EMBEDDINGS = int(os.getenv("MAX_CONCURRENT_EMBEDDINGS", "5"))
+MAX_CONCURRENT_ARTICLES = int(os.getenv("MAX_CONCURRENT_ARTICLES", "8"))  # articles per source processed at once
+PLAYWRIGHT_POOL_SIZE = int(os.getenv("PLAYWRIGHT_POOL_SIZE", "4"))  # browser contexts shared by extraction
 
 # Feature flags
 ENABLE_EMBEDDINGS = os.getenv("ENABLE_EMBEDDINGS", "true").lower() in ("true", "1", "yes", "y")
+ENABLE_HTTP_FAST_PATH = os.getenv("ENABLE_HTTP_FAST_PATH", "true").lower() in ("true", "1", "yes", "y")
 
 # Validate required configuration
 def validate_config() -> List[str]:
@@ -3,8 +3,8 @@ import os
 from jose import jwt
 from jose.exceptions import JWTError, ExpiredSignatureError, JWTClaimsError
 
-# JWT configuration - in a real app, these would be in env vars
-JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")  # Should be properly set in production
+# JWT configuration; there is no default secret, so tokens are rejected until JWT_SECRET is set
+JWT_SECRET = os.getenv("JWT_SECRET")
 JWT_ALGORITHM = "HS256"
 
 def verify_token(token: str) -> dict:
@@ -18,8 +18,11 @@ def verify_token(token: str) -> dict:
         The decoded token payload
         
     Raises:
-        ValueError: If the token is invalid
+        ValueError: If the token is invalid or JWT_SECRET is not configured
     """
+    if not JWT_SECRET:
+        raise ValueError("JWT_SECRET is not configured")
+    
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         return payload
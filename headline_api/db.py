@@ -169,6 +169,45 @@ def enqueue_job(job_type: JobType, payload: Dict[str, Any]) -> int:
         if conn:
             return_connection(conn)
 
+@retry_with_backoff(max_retries=3, base_delay=1.0)
+def enqueue_jobs(job_type: JobType, payloads: List[Dict[str, Any]]) -> List[int]:
+    """
+    Enqueue several jobs of the same type in the scrape_jobs table with one INSERT.
+    
+    Args:
+        job_type: The type of job to enqueue
+        payloads: The job payloads
+        
+    Returns:
+        The IDs of the created jobs, in the same order as payloads
+    """
+    if not payloads:
+        return []
+    
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor() as cur:
+            now = datetime.now()
+            rows = execute_values(cur, """
+                INSERT INTO scrape_jobs (job_type, payload, status, created_at, updated_at)
+                VALUES %s
+                RETURNING id
+            """, [
+                (job_type, json.dumps(payload), JobStatus.QUEUED.value, now, now)
+                for payload in payloads
+            ], page_size=len(payloads), fetch=True)
+            conn.commit()
+            return [row['id'] for row in rows]
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"Failed to enqueue {len(payloads)} jobs: {str(e)}")
+        raise
+    finally:
+        if conn:
+            return_connection(conn)
+
 @retry_with_backoff(max_retries=3, base_delay=1.0)
 def get_job_details(job_id: int) -> Optional[JobDetails]:
     """
@@ -419,6 +458,46 @@ def check_processed_url(url: str) -> Optional[ProcessedUrlStatus]:
         if conn:
             return_connection(conn)
 
+@retry_with_backoff(max_retries=3, base_delay=1.0)
+def check_processed_urls(urls: List[str]) -> Dict[str, ProcessedUrlStatus]:
+    """
+    Check which of several URLs have already been processed, in one query.
+    
+    Args:
+        urls: The URLs to check
+        
+    Returns:
+        Mapping of each already-processed URL to its status; unprocessed URLs are absent
+    """
+    if not urls:
+        return {}
+    
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor() as cur:
+            cur.execute("SELECT url, processing_status FROM processed_news_urls WHERE url = ANY(%s)", (list(urls),))
+            
+            # Same mapping as check_processed_url
+            status_map = {
+                "trash": ProcessedUrlStatus.TRASH,
+                "done": ProcessedUrlStatus.PROCESSED,
+                "processed": ProcessedUrlStatus.PROCESSED
+            }
+            
+            processed = {}
+            for row in cur.fetchall():
+                status = status_map.get(row["processing_status"])
+                if status is not None:
+                    processed[row["url"]] = status
+            return processed
+    except Exception as e:
+        logger.error(f"Failed to check processed URLs: {str(e)}")
+        raise
+    finally:
+        if conn:
+            return_connection(conn)
+
 def save_processed_url(url: str, status: ProcessedUrlStatus, city: str = "unknown") -> None:
     """
     Save a processed URL to processed_news_urls.
@@ -627,6 +706,38 @@ def get_source_by_id(source_id: str, table_name: str = "bighippo_sources") -> Op
         if conn:
             return_connection(conn)
 
+@retry_with_backoff(max_retries=3, base_delay=1.0)
+def get_sources_by_ids(source_ids: List[str], table_name: str = "bighippo_sources") -> Dict[str, Dict[str, Any]]:
+    """
+    Get several sources by ID from the specified table in one query.
+    
+    Args:
+        source_ids: The IDs of the sources
+        table_name: The name of the table to query
+        
+    Returns:
+        Mapping of str(id) to source data; IDs that were not found are absent
+    """
+    if not source_ids:
+        return {}
+    
+    conn = None
+    try:
+        conn = get_connection()
+        with conn.cursor() as cur:
+            # IN with a tuple sends untyped literals, so this works for integer and text IDs alike
+            query = sql.SQL("SELECT * FROM {} WHERE id IN %s").format(
+                sql.Identifier(table_name)
+            )
+            cur.execute(query, (tuple(source_ids),))
+            return {str(row["id"]): dict(row) for row in cur.fetchall()}
+    except Exception as e:
+        logger.error(f"Failed to get sources by ID: {str(e)}")
+        raise
+    finally:
+        if conn:
+            return_connection(conn)
+
 def claim_job() -> Optional[Dict[str, Any]]:
     """
     Claim a job from the queue using FOR UPDATE SKIP LOCKED.
@@ -6,7 +6,6 @@ import signal
 import sys
 import argparse
 from typing import Dict, Any, Optional
-import traceback
 
 import config
 from headline_api.models import JobType, JobStatus
@@ -22,6 +21,9 @@ from headline_worker.modules.article_processor import process_article_job
 from headline_worker.modules.source_processor import process_source
 from headline_worker.modules.batch_processor import process_batch
 from headline_worker.modules.multiple_sources_processor import process_multiple_sources
+from headline_worker.modules.browser_pool import playwright_pool
+from headline_worker.modules.http_session import close_diffbot_session, close_http_client
+from headline_worker.modules.openai_client import close_openai_client
 
 # Initialize logging
 logging.basicConfig(
@@ -309,8 +311,7 @@ async def process_job(job: Dict[str, Any]) -> None:
             
         await mark_job_done(job_id)
     except Exception as e:
-        error_msg = f"Error processing job {job_id}: {str(e)}\n{traceback.format_exc()}"
-        logger.error(error_msg)
+        logger.exception("Error processing job %s: %s", job_id, e)
         await mark_job_error(job_id, str(e))
         JOBS_PROCESSED.labels(job_type=job_type, status="error").inc()
 
@@ -403,7 +404,7 @@ async def main() -> None:
                 await asyncio.sleep(wait_time)
             else:
                 # Non-connection error
-                logger.error(f"Unhandled error in worker loop: {str(e)}\n{traceback.format_exc()}")
+                logger.exception("Unhandled error in worker loop: %s", e)
                 
                 # Still wait before trying again, but not as long
                 await asyncio.sleep(config.WORKER_POLL_INTERVAL)
@@ -422,6 +423,10 @@ async def main() -> None:
                     # Continue anyway, don't stop the worker
     
     logger.info("Worker shutting down...")
+    await playwright_pool.close()
+    await close_http_client()
+    await close_diffbot_session()
+    await close_openai_client()
 
 if __name__ == "__main__":
     try:
@@ -1,7 +1,13 @@
 """Prometheus metrics for the headline worker."""
-from prometheus_client import Counter, start_http_server
+import os
 import logging
 
+# The multiprocess directory must exist before prometheus_client creates any values
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess, start_http_server
+
 logger = logging.getLogger(__name__)
 
 # Initialize Prometheus metrics
@@ -32,7 +38,45 @@ ARTICLES_PROCESSED = Counter(
     ["status"]
 )
 
+AI_DATE_CALLS_AVOIDED = Counter(
+    "ai_date_calls_avoided_total",
+    "Article dates found in page metadata without calling the AI date extractor"
+)
+
+SOURCES_IN_FLIGHT = Gauge(
+    "sources_in_flight",
+    "Sources currently being processed by the batch processor",
+    multiprocess_mode="livesum"
+)
+
+SOURCE_LATENCY = Histogram(
+    "source_latency_seconds",
+    "Time spent processing a single source"
+)
+
+CLASSIFY_LATENCY = Histogram(
+    "classify_latency_seconds",
+    "Time spent waiting on the OpenAI classification call"
+)
+
+EXTRACT_LATENCY = Histogram(
+    "extract_latency_seconds",
+    "Time spent extracting article content"
+)
+
 def start_metrics_server(port=8001):
-    """Start the Prometheus metrics server."""
-    start_http_server(port)
-    logger.info(f"Prometheus metrics server started on port {port}") 
\ No newline at end of file
+    """
+    Start the Prometheus metrics server.
+    
+    When PROMETHEUS_MULTIPROC_DIR is set, counters are written to mmap'd files
+    in that directory and aggregated across worker processes at scrape time.
+    """
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=multiproc_dir)
+        start_http_server(port, registry=registry)
+        logger.info(f"Prometheus metrics server started on port {port} (multiprocess mode, dir: {multiproc_dir})")
+    else:
+        start_http_server(port)
+        logger.info(f"Prometheus metrics server started on port {port}") 
\ No newline at end of file
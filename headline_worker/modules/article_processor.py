@@ -8,8 +8,9 @@ from datetime import datetime
 import config
 from headline_api.db import check_processed_url, save_processed_url, save_article, update_job_status
 from headline_api.models import Article, JobStatus, ProcessedUrlStatus
-from headline_worker.modules.content_extractor import extract_content, canonicalize_url
+from headline_worker.modules.content_extractor import FilteredUrlError, extract_content, canonicalize_url
 from headline_worker.modules.content_classifier import classify_content, get_audience_scope
+from headline_worker.modules.date_extractor import DateMethod
 from headline_worker.modules.summary_generator import process_article
 
 # Import embeddings module only if enabled
@@ -18,13 +19,15 @@ if config.ENABLE_EMBEDDINGS:
 
 logger = logging.getLogger(__name__)
 
-async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
+async def process_article_job(job_id: int, payload: Dict[str, Any], already_checked: bool = False) -> None:
     """
     Process an article scraping job.
     
     Args:
         job_id: The job ID
         payload: The job payload
+        already_checked: Whether the caller has just checked processed_news_urls for this URL
+            (the source processor checks all of a source's links in one query)
         
     Raises:
         RuntimeError: If article processing fails
@@ -35,19 +38,24 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
     if not url:
         raise ValueError("Missing URL in job payload")
     
-    logger.info(f"Processing article: {url}")
+    logger.info("Processing article: %s", url)
+    
+    # Database calls are blocking, so run them in the executor
+    loop = asyncio.get_running_loop()
     
     # Canonicalize URL
     canonical_url = canonicalize_url(url)
-    logger.info(f"Canonical URL: {canonical_url}")
+    logger.info("Canonical URL: %s", canonical_url)
     
     # Check if URL has already been processed
-    processed_status = check_processed_url(canonical_url)
+    processed_status = None
+    if not already_checked:
+        processed_status = await loop.run_in_executor(None, check_processed_url, canonical_url)
     if processed_status:
-        logger.info(f"URL {canonical_url} already processed with status: {processed_status}")
+        logger.info("URL %s already processed with status: %s", canonical_url, processed_status)
         
         # Update job status
-        update_job_status(job_id, JobStatus.DONE)
+        await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
         return
     
     # Check if we have pre-extracted content in payload (from source processor)
@@ -64,37 +72,44 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
             "scraper_type": payload.get("scraper_type", "unknown"),
             "clean_html": payload.get("clean_html")
         }
-        logger.info(f"Using pre-extracted content for {url}")
+        logger.info("Using pre-extracted content for %s", url)
     else:
         # Extract content fresh (for direct article jobs)
-        content = await extract_content(url)
+        try:
+            content = await extract_content(url)
+        except FilteredUrlError:
+            logger.info("URL matches obvious non-news pattern, skipping: %s", url)
+            await loop.run_in_executor(None, save_processed_url, canonical_url, ProcessedUrlStatus.TRASH)
+            await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
+            return
     
     # Check if we have pre-computed classification in payload
     if payload.get("classification"):
         # Use pre-computed classification to avoid re-classifying
         from headline_api.models import ArticleClassification
         classification = ArticleClassification.model_validate(payload["classification"])
-        logger.info(f"Using pre-computed classification for {url}: {classification.label}")
+        logger.info("Using pre-computed classification for %s: %s", url, classification.label)
     else:
         # Classify content fresh (for direct article jobs or if classification failed earlier)
         classification = await classify_content(content["title"], content["text"], url)
-        logger.info(f"Fresh classification for {url}: {classification}")
+        logger.info("Fresh classification for %s: %s", url, classification)
     
     if classification.label == "trash":
-        logger.info(f"Article {url} classified as trash, skipping")
+        logger.info("Article %s classified as trash, skipping", url)
         
         # Save in processed_urls
-        save_processed_url(canonical_url, ProcessedUrlStatus.TRASH)
+        await loop.run_in_executor(None, save_processed_url, canonical_url, ProcessedUrlStatus.TRASH)
         
         # Update job status
-        update_job_status(job_id, JobStatus.DONE)
+        await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
         return
     
     # Validate content quality before expensive AI processing
-    if not content.get("text") or len(content.get("text", "").strip()) < 50:
-        logger.warning(f"Article {url} has insufficient content ({len(content.get('text', ''))} chars), skipping")
-        save_processed_url(canonical_url, ProcessedUrlStatus.TRASH)
-        update_job_status(job_id, JobStatus.DONE)
+    full_content = content.get("text", "")
+    if not full_content or len(full_content.strip()) < 50:
+        logger.warning("Article %s has insufficient content (%s chars), skipping", url, len(full_content or ''))
+        await loop.run_in_executor(None, save_processed_url, canonical_url, ProcessedUrlStatus.TRASH)
+        await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
         return
     
     # Process article with appropriate prompt
@@ -108,19 +123,20 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
     )
     
     # Log the full result for debugging
-    logger.info(f"Summary generator result: {json.dumps(result, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Summary generator result: %s", json.dumps(result, indent=2))
     
     # Parse date - now comes from our improved extraction system
     date_posted = None
     if content.get("date"):
         try:
             date_posted = datetime.fromisoformat(content["date"])
-            logger.info(f"Successfully parsed date: {date_posted} using method: {content.get('date_extraction_method', 'unknown')}")
+            logger.info("Successfully parsed date: %s using method: %s", date_posted, content.get('date_extraction_method', 'unknown'))
         except (ValueError, TypeError):
-            logger.warning(f"Could not parse date: {content.get('date')}")
+            logger.warning("Could not parse date: %s", content.get('date'))
     else:
         extraction_method = content.get("date_extraction_method", "unknown")
-        if extraction_method == "failed":
+        if extraction_method == DateMethod.FAILED:
             logger.info("No date found by extraction system - this is expected for non-news content (ads, job pages, etc.)")
         else:
             logger.warning("No date found by extraction system")
@@ -128,7 +144,7 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
     # Log extraction method for monitoring
     extraction_method = content.get("date_extraction_method", "unknown")
     scraper_type = content.get("scraper_type", "unknown")
-    logger.info(f"Article processed with scraper: {scraper_type}, date method: {extraction_method}")
+    logger.info("Article processed with scraper: %s, date method: %s", scraper_type, extraction_method)
     
     # Extract complete city for processed_url table (for deduplication purposes)
     city_for_dedupe = "unknown"
@@ -147,6 +163,8 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
         summary_medium = result.get("medium_summary")
         summary_long = result.get("long_summary")
     
+    subtopics = result.get("subtopics") or []
+    
     # Create article
     article = Article(
         url=url,
@@ -157,22 +175,22 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
         summary_long=summary_long,
         topic=result.get("topic"),  # Topic field from prompt (e.g., Government | Finance | Sports | Local News)
         main_topic=result.get("main_topic"),  # New Main Topic field from prompt (e.g., Politics, Business, Technology, etc.)
-        topic_2=result.get("subtopics", [])[0] if result.get("subtopics") and len(result.get("subtopics", [])) > 0 else None,  # First subtopic
-        topic_3=result.get("subtopics", [])[1] if result.get("subtopics") and len(result.get("subtopics", [])) > 1 else None,  # Second subtopic
+        topic_2=subtopics[0] if subtopics else None,  # First subtopic
+        topic_3=subtopics[1] if len(subtopics) > 1 else None,  # Second subtopic
         grade=int(result.get("score", 0)),  # Same score for grade
         date_posted=date_posted,
         is_embedded=False,
         audience_scope=audience_scope,
-        full_content=content.get("text", ""),  # Original scraped content
+        full_content=full_content,  # Original scraped content
         meta_data=content.get("metadata", {})  # Original metadata
     )
     
     # Save article
-    article_id = save_article(article)
-    logger.info(f"Saved article with ID: {article_id}")
+    article_id = await loop.run_in_executor(None, save_article, article)
+    logger.info("Saved article with ID: %s", article_id)
     
     # Mark URL as processed - use just the city name for deduplication
-    save_processed_url(canonical_url, ProcessedUrlStatus.PROCESSED, city_for_dedupe)
+    await loop.run_in_executor(None, save_processed_url, canonical_url, ProcessedUrlStatus.PROCESSED, city_for_dedupe)
     
     # Only do embedding if enabled
     if config.ENABLE_EMBEDDINGS:
@@ -212,8 +230,8 @@ async def process_article_job(job_id: int, payload: Dict[str, Any]) -> None:
             # Log error but don't fail the job
             logger.error(f"Failed to embed article {article_id}: {str(e)}")
     else:
-        logger.info(f"Embeddings disabled, skipping for article {article_id}")
+        logger.info("Embeddings disabled, skipping for article %s", article_id)
     
     # Update job status
-    update_job_status(job_id, JobStatus.DONE)
-    logger.info(f"Article {url} processed successfully") 
\ No newline at end of file
+    await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
+    logger.info("Article %s processed successfully", url) 
\ No newline at end of file
@@ -7,6 +7,7 @@ import config
 from headline_api.db import enqueue_job, update_job_status, update_job_counters, select_sources_for_batch
 from headline_api.models import JobType, JobStatus
 from headline_worker.modules.source_processor import process_source
+from headline_worker.metrics import SOURCES_IN_FLIGHT, SOURCE_LATENCY
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,9 @@ logger = logging.getLogger(__name__)
 # to stay within rate limits
 MAX_CONCURRENT_SOURCES = max(1, min(8, len(config.DIFFBOT_KEYS) - 1))
 
+# Number of completed sources between job counter updates
+COUNTER_FLUSH_INTERVAL = 10
+
 async def process_batch(job_id: int, payload: Dict[str, Any]) -> None:
     """
     Process a batch of sources in parallel.
@@ -32,16 +36,19 @@ async def process_batch(job_id: int, payload: Dict[str, Any]) -> None:
     
     logger.info(f"Processing batch of size {batch_size} with max concurrency {MAX_CONCURRENT_SOURCES}")
     
+    # Database calls are blocking, so run them in the executor
+    loop = asyncio.get_running_loop()
+    
     # Select sources from database
-    sources = select_sources_for_batch(batch_size, query)
+    sources = await loop.run_in_executor(None, select_sources_for_batch, batch_size, query)
     logger.info(f"Selected {len(sources)} sources")
     
     # Update job counters
-    update_job_counters(job_id, {"links_found": len(sources)})
+    await loop.run_in_executor(None, update_job_counters, job_id, {"links_found": len(sources)})
     
     if dry_run:
         logger.info("Dry run, not processing sources")
-        update_job_status(job_id, JobStatus.DONE)
+        await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
         return
     
     # Process sources in parallel with controlled concurrency
@@ -51,9 +58,8 @@ async def process_batch(job_id: int, payload: Dict[str, Any]) -> None:
     # Use a semaphore to control concurrency
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
     
-    async def process_source_with_semaphore(source):
+    async def process_source_with_semaphore(source) -> bool:
         """Process a single source using a semaphore for concurrency control"""
-        nonlocal sources_processed, errors
         async with semaphore:
             source_id = source["id"]
             
@@ -64,28 +70,47 @@ async def process_batch(job_id: int, payload: Dict[str, Any]) -> None:
                 "limit": 15  # Limit to 15 links per source
             }
             
+            SOURCES_IN_FLIGHT.inc()
             try:
                 logger.info(f"Processing source {source_id}")
                 # Process source directly without enqueuing a separate job
-                await process_source(str(source_id), source_payload)
-                sources_processed += 1
-                logger.info(f"Completed source {source_id} ({sources_processed}/{len(sources)})")
+                with SOURCE_LATENCY.time():
+                    await process_source(str(source_id), source_payload)
+                logger.info(f"Completed source {source_id}")
+                return True
             except Exception as e:
-                errors += 1
                 logger.error(f"Error processing source {source_id}: {str(e)}")
-            
-            # Update job counters
-            update_job_counters(job_id, {
-                "articles_saved": sources_processed,
-                "errors": errors
-            })
+                return False
+            finally:
+                SOURCES_IN_FLIGHT.dec()
+    
+    async def flush_counters() -> None:
+        """Push the aggregated counters to the database"""
+        await loop.run_in_executor(None, update_job_counters, job_id, {
+            "articles_saved": sources_processed,
+            "errors": errors
+        })
     
     # Create tasks for all sources
-    tasks = [process_source_with_semaphore(source) for source in sources]
+    tasks = [asyncio.create_task(process_source_with_semaphore(source)) for source in sources]
+    
+    # Aggregate results as they complete, flushing counters periodically
+    # instead of issuing a database update for every source
+    completed = 0
+    for next_done in asyncio.as_completed(tasks):
+        if await next_done:
+            sources_processed += 1
+        else:
+            errors += 1
+        completed += 1
+        
+        if completed % COUNTER_FLUSH_INTERVAL == 0:
+            logger.info(f"Batch progress: {completed}/{len(sources)} sources completed")
+            await flush_counters()
     
-    # Wait for all tasks to complete
-    await asyncio.gather(*tasks)
+    if completed % COUNTER_FLUSH_INTERVAL != 0:
+        await flush_counters()
     
     # Update job status
-    update_job_status(job_id, JobStatus.DONE)
+    await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
     logger.info(f"Batch processing complete: {sources_processed} sources processed, {errors} errors") 
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""Shared Playwright browser pool for the headline worker."""
+import logging
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Route
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Resource types never needed when we only read the DOM
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Ad and analytics hosts whose scripts only slow page loads down
+BLOCKED_URL_PATTERN = re.compile(
+    r'doubleclick\.net|googletagmanager\.com|google-analytics\.com|googlesyndication\.com|facebook\.net|scorecardresearch\.com'
+)
+
+async def _route_handler(route: Route) -> None:
+    """Abort requests for heavy resources and trackers, let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_PATTERN.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_heavy_resources(page: Page) -> None:
+    """
+    Stop a page from downloading images, media, fonts, stylesheets and trackers.
+    
+    Args:
+        page: The page to install the route handler on
+    """
+    await page.route('**/*', _route_handler)
+
+class PlaywrightPool:
+    """
+    Pool of Playwright browser contexts backed by a single long-lived Chromium.
+
+    Launching Chromium costs hundreds of milliseconds, so the browser is started
+    once per worker and each URL gets a fresh page from a pre-warmed context.
+    Contexts are recycled after a fixed number of pages to bound memory.
+    """
+
+    def __init__(self, size: int = 4, max_pages_per_context: int = 50):
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._contexts: Optional[asyncio.Queue] = None
+        self._page_counts: Dict[BrowserContext, int] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        """Whether the browser is running and connected"""
+        return self._browser is not None and self._browser.is_connected()
+
+    async def start(self) -> None:
+        """Launch the browser and pre-create the context pool (no-op if already running)"""
+        async with self._lock:
+            if self.started:
+                return
+
+            # Clean up after a crashed browser before relaunching
+            if self._playwright is not None:
+                await self._shutdown()
+
+            logger.info(f"Launching shared Chromium browser with {self.size} contexts")
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch()
+            self._contexts = asyncio.Queue()
+            for _ in range(self.size):
+                self._contexts.put_nowait(await self._new_context())
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a new isolated browser context"""
+        context = await self._browser.new_context(ignore_https_errors=True)  # Ignore SSL certificate errors
+        self._page_counts[context] = 0
+        return context
+
+    async def acquire(self) -> BrowserContext:
+        """
+        Take a context from the pool, starting the browser if needed.
+
+        Returns:
+            A browser context reserved for the caller
+        """
+        if not self.started:
+            await self.start()
+        return await self._contexts.get()
+
+    async def release(self, context: BrowserContext) -> None:
+        """
+        Return a context to the pool, replacing it once it has served enough pages.
+
+        Args:
+            context: The context previously returned by acquire()
+        """
+        if context not in self._page_counts:
+            # Context belongs to a browser that has since been shut down
+            return
+
+        self._page_counts[context] += 1
+
+        if self.started and self._page_counts[context] < self.max_pages_per_context:
+            self._contexts.put_nowait(context)
+            return
+
+        self._page_counts.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {str(e)}")
+
+        if self.started:
+            try:
+                context = await self._new_context()
+            except Exception as e:
+                logger.warning(f"Failed to create replacement browser context: {str(e)}")
+                return
+            self._contexts.put_nowait(context)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Open a fresh page in a pooled context.
+
+        Yields:
+            A new Playwright page, closed and returned to the pool on exit
+        """
+        context = await self.acquire()
+        try:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+        finally:
+            await self.release(context)
+
+    async def _shutdown(self) -> None:
+        """Close the browser and stop Playwright"""
+        self._page_counts.clear()
+        self._contexts = None
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {str(e)}")
+        try:
+            if self._playwright is not None:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping Playwright: {str(e)}")
+        self._browser = None
+        self._playwright = None
+
+    async def close(self) -> None:
+        """Shut down the shared browser"""
+        async with self._lock:
+            await self._shutdown()
+
+# Global Playwright pool instance
+playwright_pool = PlaywrightPool(size=config.PLAYWRIGHT_POOL_SIZE)
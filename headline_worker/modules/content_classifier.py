@@ -1,17 +1,87 @@
 """Content classifier module using GPT-4o-mini."""
 import logging
-import json
+import string
 from typing import Dict, Any, Optional
-import openai
-import re
-import traceback
 
-import config
+import orjson
+
 from headline_api.models import ArticleClassification
+from headline_worker.metrics import CLASSIFY_LATENCY
+from headline_worker.modules.openai_client import get_openai_client
 from headline_worker.prompts import CLASSIFIER_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Articles shorter than this are never worth sending to OpenAI
+MIN_CLASSIFIABLE_LENGTH = 200
+
+# Boilerplate phrases that indicate a blocked or placeholder page rather than an article
+TRASH_TEXT_MARKERS = (
+    "enable javascript",
+    "javascript is disabled",
+    "please enable cookies",
+    "access denied",
+)
+
+# Only pages shorter than this are checked for the phrases above; real articles can quote them
+TRASH_MARKER_MAX_LENGTH = 1000
+
+# Title suffixes used by login/sign-in pages
+TRASH_TITLE_SUFFIXES = ("- login", "| login", "- sign in", "| sign in")
+
+def _is_obvious_trash(title: str, text: str) -> bool:
+    """
+    Cheap heuristic check for content that is clearly not a news article.
+    
+    Args:
+        title: The article title
+        text: The article text
+        
+    Returns:
+        True if the content can be classified as trash without calling OpenAI
+    """
+    stripped = text.strip() if text else ''
+    if len(stripped) < MIN_CLASSIFIABLE_LENGTH:
+        return True
+    
+    if len(stripped) < TRASH_MARKER_MAX_LENGTH:
+        lowered = stripped.lower()
+        if any(marker in lowered for marker in TRASH_TEXT_MARKERS):
+            return True
+    
+    if title and title.strip().lower().endswith(TRASH_TITLE_SUFFIXES):
+        return True
+    
+    return False
+
+# CLASSIFIER_PROMPT parsed once into (literal text, field name) pairs, with {{ }} already unescaped
+_CLASSIFIER_PROMPT_PARTS = tuple(
+    (literal, field_name) for literal, field_name, _, _ in string.Formatter().parse(CLASSIFIER_PROMPT)
+)
+
+def render_classifier_prompt(url: str, title: str, text: str) -> str:
+    """
+    Fill the classifier prompt's fields in a single join, without re-parsing the template.
+    
+    Args:
+        url: The article URL
+        title: The article title
+        text: The article text
+        
+    Returns:
+        The complete prompt
+        
+    Raises:
+        KeyError: If the prompt contains a field other than url, title or text
+    """
+    values = {"url": url, "title": title, "text": text}
+    chunks = []
+    for literal, field_name in _CLASSIFIER_PROMPT_PARTS:
+        chunks.append(literal)
+        if field_name is not None:
+            chunks.append(values[field_name])
+    return "".join(chunks)
+
 def extract_json_from_text(text: str) -> str:
     """
     Extract valid JSON from text, handling potential formatting issues.
@@ -32,14 +102,32 @@ def extract_json_from_text(text: str) -> str:
         text = text[:-3]
     text = text.strip()
     
-    # Try to find JSON-like structure using regex
-    json_pattern = r'(?:\s*\{\s*.*?\s*\}\s*)'
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    if matches:
-        return matches[0]
+    # Find the first balanced {...} object with a linear scan that ignores braces inside strings
+    start = text.find('{')
+    if start < 0:
+        return text
     
-    # If no pattern match, return the original text 
-    return text
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = in_string
+        elif char == '"':
+            in_string = not in_string
+        elif not in_string:
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+    
+    # Unbalanced: return from the first brace and let the JSON parser report the error
+    return text[start:]
 
 async def classify_content(title: str, text: str, url: str = None) -> ArticleClassification:
     """
@@ -56,10 +144,19 @@ async def classify_content(title: str, text: str, url: str = None) -> ArticleCla
     Raises:
         ValueError: If classification fails
     """
+    # Skip the OpenAI call entirely for obviously empty or blocked pages
+    if _is_obvious_trash(title, text):
+        logger.info(f"Content for {url or title} is obvious trash, skipping AI classification")
+        return ArticleClassification(
+            label="trash",
+            city_slug=None,
+            industry_slug=None
+        )
+    
     try:
         # Format the prompt with article content - catch format errors
         try:
-            formatted_prompt = CLASSIFIER_PROMPT.format(
+            formatted_prompt = render_classifier_prompt(
                 url=url or "URL not provided",
                 title=title,
                 text=text[:1000]  # Use first 1000 chars to save tokens
@@ -79,16 +176,17 @@ async def classify_content(title: str, text: str, url: str = None) -> ArticleCla
         
         # Call OpenAI API with detailed error handling
         try:
-            client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a content classifier assistant that responds with valid JSON only."},
-                    {"role": "user", "content": formatted_prompt}
-                ],
-                temperature=0.1,  # Low temperature for consistent results
-                response_format={"type": "json_object"}
-            )
+            client = get_openai_client()
+            with CLASSIFY_LATENCY.time():
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": "You are a content classifier assistant that responds with valid JSON only."},
+                        {"role": "user", "content": formatted_prompt}
+                    ],
+                    temperature=0.1,  # Low temperature for consistent results
+                    response_format={"type": "json_object"}
+                )
             
             # Log the full response structure for debugging
             logger.debug(f"OpenAI response structure: {type(response)}")
@@ -104,7 +202,6 @@ async def classify_content(title: str, text: str, url: str = None) -> ArticleCla
             
         except Exception as e:
             logger.error(f"OpenAI API call failed: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
             raise ValueError(f"OpenAI API call failed: {str(e)}")
         
         # Clean and extract valid JSON
@@ -113,8 +210,8 @@ async def classify_content(title: str, text: str, url: str = None) -> ArticleCla
         
         # Parse JSON with dedicated error handling
         try:
-            result = json.loads(cleaned_text)
-        except json.JSONDecodeError as e:
+            result = orjson.loads(cleaned_text)
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON parse error: {str(e)} in text: {cleaned_text}")
             # Try a more aggressive approach
             try:
@@ -124,7 +221,7 @@ async def classify_content(title: str, text: str, url: str = None) -> ArticleCla
                 if start >= 0 and end > start:
                     possible_json = cleaned_text[start:end+1]
                     logger.debug(f"Extracted JSON subset: {possible_json}")
-                    result = json.loads(possible_json)
+                    result = orjson.loads(possible_json)
                     logger.info(f"Successfully parsed JSON after manual extraction")
                 else:
                     raise ValueError("Could not find valid JSON structure in response")
@@ -170,8 +267,7 @@ async def classify_content(title: str, text: str, url: str = None) -> ArticleCla
         )
     except Exception as e:
         # Catch-all exception handler
-        logger.error(f"Content classification failed: {str(e)}")
-        logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.exception("Content classification failed: %s", e)
         # Fallback to a safe default
         logger.warning("Using fallback classification: trash")
         return ArticleClassification(
@@ -1,81 +1,344 @@
 """Content extraction module using Playwright and Readability."""
 import re
 import logging
-from typing import Dict, Any, Optional
-from urllib.parse import urlparse, urlunparse, parse_qs
-from playwright.async_api import async_playwright, Error as PlaywrightError
+import hashlib
+from typing import Dict, Any, List, Optional, Tuple, TypedDict
+from urllib.parse import urlparse
+import httpx
+from playwright.async_api import Error as PlaywrightError
 from readability import Document
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from lxml import etree, html as lxml_html
+from lxml.html.clean import Cleaner
 
+import config
+from headline_worker.modules.browser_pool import block_heavy_resources, playwright_pool
 from headline_worker.modules.diffbot import fetch_via_diffbot, fetch_via_diffbot_async
+from headline_worker.modules.http_session import JS_REQUIRED_RE, get_http_client
 from headline_worker.modules.url_utils import canonicalize_url, is_valid_article_url
 from headline_worker.modules.date_extractor import extract_date_priority_system
 
 logger = logging.getLogger(__name__)
 
+# Single-pass DOM cleaners (lxml) used instead of backtracking regexes
+_CLEANER_OPTIONS = dict(
+    scripts=True,
+    javascript=False,
+    comments=True,
+    style=True,
+    inline_style=False,
+    links=False,
+    meta=False,
+    page_structure=False,
+    processing_instructions=True,
+    embedded=False,
+    frames=False,
+    forms=False,
+    annoying_tags=False,
+    remove_unknown_tags=False,
+    safe_attrs_only=False,
+)
+
+# Strips script and style elements only
+_SCRIPT_STYLE_CLEANER = Cleaner(**_CLEANER_OPTIONS)
+
+# Also strips navigation, headers, footers and sidebars
+_NON_CONTENT_CLEANER = Cleaner(kill_tags=['nav', 'header', 'footer', 'aside'], **_CLEANER_OPTIONS)
+
+# Class/id tokens marking ad, navigation and other non-content blocks
+_NON_CONTENT_ATTR_RE = re.compile(
+    r'(?:^|[\s_-])(?:ad|ads|advertisement|banner|sidebar|footer|header|nav|menu|social|related|comment|comments)(?:$|[\s_-])',
+    re.IGNORECASE
+)
+
+# Markdown prefix/suffix emitted around each element's content
+_MARKDOWN_WRAPPERS = {
+    **{f'h{level}': ('## ', '\n') for level in range(1, 7)},  # Headers to ##
+    'p': ('', '\n\n'),  # Paragraphs
+    'li': ('* ', '\n'),  # List items
+    'strong': ('**', '**'),  # Bold
+    'b': ('**', '**'),  # Bold
+    'em': ('*', '*'),  # Italic
+    'i': ('*', '*'),  # Italic
+    'blockquote': ('> ', '\n'),  # Quotes
+}
+
+# Small documents without any of these tags skip the markdown walk
+SHORT_HTML_LENGTH = 2048
+_MARKDOWN_TAG_RE = re.compile(r'<(?:h[1-6]|p|br|li|strong|b|em|i|blockquote)\b', re.IGNORECASE)
+
+class NonHtmlContentError(RuntimeError):
+    """Raised when a URL turns out to serve a feed, JSON, PDF or other non-HTML content"""
+
+class FilteredUrlError(RuntimeError):
+    """Raised when a URL matches an obvious non-article pattern, before anything is fetched"""
+
+class ExtractResult(TypedDict):
+    """Content extracted from a single article URL"""
+    title: Optional[str]
+    text: str
+    markdown: str
+    metadata: Dict[str, Any]
+    clean_html: str
+    date: Optional[str]  # ISO 8601
+    scraper_type: str  # "http", "playwright" or "diffbot"
+    date_extraction_method: str
+
+# Extraction results keyed by canonical URL
+EXTRACT_CACHE_TTL = 3600  # seconds
+_EXTRACT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=EXTRACT_CACHE_TTL)
+
+# Readability output keyed by a fingerprint of the page HTML
+_PARSED_HTML_CACHE: TTLCache = TTLCache(maxsize=1_000, ttl=EXTRACT_CACHE_TTL)
+
+# Plain HTTP fetch tried before Playwright
+FAST_PATH_MIN_TEXT_LENGTH = 500
+
+# Domains of obvious non-news sites (matched as a suffix of the host)
+NON_NEWS_DOMAINS = [
+    'apps.apple.com', 'play.google.com', 'chrome.google.com',
+    'itunes.apple.com', 'music.apple.com',
+    'github.com', 'gitlab.com', 'bitbucket.org',
+    'linkedin.com', 'instagram.com', 'pinterest.com',
+    'youtube.com', 'youtu.be', 'vimeo.com',
+    'amazon.com', 'ebay.com', 'etsy.com',
+    'wikipedia.org', 'wikimedia.org'
+]
+
+# URL path patterns for obvious non-news content and RSS feeds
+NON_NEWS_PATTERNS = [
+    '/privacy-policy', '/privacy', '/terms-of-service', '/terms', 
+    '/contact-us', '/contact', '/about-us', '/about',
+    '/advertise-with-us', '/advertise',
+    '/sitemap', '/robots.txt', '.xml', '.json',
+    '/feed', '/rss', '/feeds/', '.rss', '.atom',  # RSS/Atom feeds
+    '/api/', '/wp-json/', '/xmlrpc.php'  # API endpoints
+]
+
+# Each blocklist compiled into one alternation so a URL is scanned once
+_NON_NEWS_DOMAIN_RE = re.compile('(?:' + '|'.join(map(re.escape, NON_NEWS_DOMAINS)) + ')$')
+_NON_NEWS_PATH_RE = re.compile('|'.join(map(re.escape, NON_NEWS_PATTERNS)))
+
+# Collects {name|property: content} for every meta tag on the page
+_META_TAGS_JS = """() => {
+    const metadata = {};
+    for (const meta of document.querySelectorAll('meta')) {
+        const key = meta.getAttribute('name') || meta.getAttribute('property');
+        const content = meta.getAttribute('content');
+        if (key && content) {
+            metadata[key] = content;
+        }
+    }
+    return metadata;
+}"""
+
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+def _walk(element: lxml_html.HtmlElement, text_parts: List[str], markdown_parts: List[str]) -> None:
+    """
+    Append an element's text and markdown to the output buffers, depth first.
+    
+    Args:
+        element: The element to render
+        text_parts: Plain-text fragments, one per DOM text node
+        markdown_parts: Markdown fragments in document order
+    """
+    tag = element.tag if isinstance(element.tag, str) else None
+    
+    if tag == 'br':
+        markdown_parts.append('\n')
+    elif tag is not None:
+        prefix, suffix = _MARKDOWN_WRAPPERS.get(tag.lower(), ('', ''))
+        markdown_parts.append(prefix)
+        if element.text:
+            text_parts.append(element.text)
+            markdown_parts.append(element.text)
+        for child in element:
+            _walk(child, text_parts, markdown_parts)
+        markdown_parts.append(suffix)
+    
+    if element.tail:
+        text_parts.append(element.tail)
+        markdown_parts.append(element.tail)
+
+def summarize(content_html: str, include_clean_html: bool = True) -> Tuple[str, str, str]:
+    """
+    Derive plain text, markdown and AI-ready HTML from article HTML in one parse.
+    
+    The HTML is parsed and stripped of scripts/styles once; a single walk of the
+    tree then emits text and markdown together, after which navigation, headers,
+    footers and ad/sidebar blocks are removed from the same tree for clean_html.
+    
+    Args:
+        content_html: The article HTML (e.g. Readability's summary)
+        include_clean_html: Whether to build clean_html; skip it when only text/markdown are needed
+        
+    Returns:
+        Tuple of (text, markdown, clean_html); clean_html is empty if not requested
+    """
+    if not content_html or not content_html.strip():
+        return '', '', ''
+    
+    try:
+        doc = lxml_html.fromstring(content_html)
+    except (etree.ParserError, ValueError):
+        return '', '', ''
+    
+    # Remove script and style elements
+    _SCRIPT_STYLE_CLEANER(doc)
+    
+    if len(content_html) < SHORT_HTML_LENGTH and not _MARKDOWN_TAG_RE.search(content_html):
+        # Nothing to format, so the markdown is just the text nodes in order
+        text_parts = markdown_parts = list(doc.itertext())
+    else:
+        text_parts = []
+        markdown_parts = []
+        _walk(doc, text_parts, markdown_parts)
+    
+    text = ' '.join(' '.join(text_parts).split())
+    markdown = _BLANK_LINES_RE.sub('\n\n', ''.join(markdown_parts)).strip()
+    
+    if not include_clean_html:
+        return text, markdown, ''
+    
+    # Remove common non-content elements for AI analysis
+    _NON_CONTENT_CLEANER(doc)
+    for div in doc.xpath('//div[@class or @id]'):
+        if (_NON_CONTENT_ATTR_RE.search(div.get('class', '')) or
+                _NON_CONTENT_ATTR_RE.search(div.get('id', ''))):
+            div.drop_tree()
+    
+    clean_html = _BLANK_LINES_RE.sub('\n\n', lxml_html.tostring(doc, encoding='unicode')).strip()
+    
+    return text, markdown, clean_html
+
 def convert_to_markdown(html_content: str) -> str:
     """
     Convert HTML content to markdown format.
     Preserves basic structure while removing unnecessary HTML.
     """
-    # Remove script and style elements
-    html_content = re.sub(r'<script.*?</script>', '', html_content, flags=re.DOTALL)
-    html_content = re.sub(r'<style.*?</style>', '', html_content, flags=re.DOTALL)
-    
-    # Convert common HTML elements to markdown
-    conversions = [
-        (r'<h[1-6][^>]*>(.*?)</h[1-6]>', r'## \1\n'),  # Headers to ##
-        (r'<p[^>]*>(.*?)</p>', r'\1\n\n'),  # Paragraphs
-        (r'<br[^>]*>', r'\n'),  # Line breaks
-        (r'<li[^>]*>(.*?)</li>', r'* \1\n'),  # List items
-        (r'<strong[^>]*>(.*?)</strong>', r'**\1**'),  # Bold
-        (r'<b[^>]*>(.*?)</b>', r'**\1**'),  # Bold
-        (r'<em[^>]*>(.*?)</em>', r'*\1*'),  # Italic
-        (r'<i[^>]*>(.*?)</i>', r'*\1*'),  # Italic
-        (r'<blockquote[^>]*>(.*?)</blockquote>', r'> \1\n'),  # Quotes
-    ]
-    
-    for pattern, replacement in conversions:
-        html_content = re.sub(pattern, replacement, html_content, flags=re.DOTALL|re.IGNORECASE)
-    
-    # Remove remaining HTML tags
-    text = re.sub(r'<[^>]+>', '', html_content)
-    
-    # Clean up whitespace
-    text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-    text = text.strip()
-    
-    return text
+    return summarize(html_content, include_clean_html=False)[1]
 
 def clean_html_for_ai(html_content: str) -> str:
     """
     Clean HTML content for AI analysis by removing headers, footers, navigation, ads, etc.
     Keep only the main article content.
     """
-    # Remove script and style elements
-    html_content = re.sub(r'<script.*?</script>', '', html_content, flags=re.DOTALL)
-    html_content = re.sub(r'<style.*?</style>', '', html_content, flags=re.DOTALL)
-    
-    # Remove common non-content elements
-    patterns_to_remove = [
-        r'<nav.*?</nav>',  # Navigation
-        r'<header.*?</header>',  # Headers
-        r'<footer.*?</footer>',  # Footers
-        r'<aside.*?</aside>',  # Sidebars
-        r'<div[^>]*class="[^"]*(?:ad|advertisement|banner|sidebar|footer|header|nav|menu|social|related|comment)[^"]*".*?</div>',  # Ad/nav divs
-        r'<div[^>]*id="[^"]*(?:ad|advertisement|banner|sidebar|footer|header|nav|menu|social|related|comment)[^"]*".*?</div>',  # Ad/nav divs by ID
-    ]
-    
-    for pattern in patterns_to_remove:
-        html_content = re.sub(pattern, '', html_content, flags=re.DOTALL|re.IGNORECASE)
-    
-    # Clean up excessive whitespace
-    html_content = re.sub(r'\n\s*\n\s*\n', '\n\n', html_content)
-    html_content = html_content.strip()
-    
-    return html_content
+    return summarize(html_content)[2]
+
+def _parse_article_html(html_content: str) -> Tuple[str, str, str]:
+    """
+    Run Readability on a page and derive text, markdown and clean HTML.
+    
+    Results are cached by a fingerprint of the page HTML, since the pipeline
+    is deterministic and pages are often fetched again unchanged.
+    
+    Args:
+        html_content: The full page HTML
+        
+    Returns:
+        Tuple of (text, markdown, clean_html)
+    """
+    fingerprint = hashlib.blake2b(html_content.encode('utf-8', 'replace'), digest_size=16).hexdigest()
+    cached = _PARSED_HTML_CACHE.get(fingerprint)
+    if cached is not None:
+        return cached
+    
+    doc = Document(html_content)
+    
+    # Extract main content, then derive text, markdown and clean HTML in one pass
+    parsed = summarize(doc.summary())
+    _PARSED_HTML_CACHE[fingerprint] = parsed
+    return parsed
+
+def _extract_page_metadata(html_content: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Read the title and meta tags from raw page HTML.
+    
+    Args:
+        html_content: The full page HTML
+        
+    Returns:
+        Tuple of (title, {name|property: content})
+    """
+    try:
+        doc = lxml_html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return '', {}
+    
+    title = (doc.findtext('.//title') or '').strip()
+    
+    metadata = {}
+    for meta in doc.iter('meta'):
+        key = meta.get('name') or meta.get('property')
+        content = meta.get('content')
+        if key and content:
+            metadata[key] = content
+    
+    return title, metadata
+
+async def extract_content_with_http(url: str) -> Optional[ExtractResult]:
+    """
+    Try to extract content from a URL with a plain HTTP GET, without a browser.
+    
+    Args:
+        url: The URL to extract content from
+        
+    Returns:
+        Dictionary with extracted title, text, markdown, metadata, clean_html and date,
+        or None if the page needs a browser (non-200, JS-rendered or too short)
+        
+    Raises:
+        NonHtmlContentError: If the URL serves something other than HTML
+    """
+    try:
+        response = await get_http_client().get(url)
+    except httpx.HTTPError as e:
+        logger.debug("HTTP fast path failed for %s: %s", url, e)
+        return None
+    
+    if response.status_code != 200:
+        return None
+    
+    # Feeds, JSON and documents are never articles, so don't hand them to a browser
+    content_type = response.headers.get('content-type', '')
+    if content_type and 'html' not in content_type:
+        raise NonHtmlContentError(f"URL serves non-HTML content ({content_type}): {url}")
+    
+    html_content = response.text
+    if JS_REQUIRED_RE.search(html_content):
+        logger.debug("HTTP fast path skipped for %s: page requires JavaScript", url)
+        return None
+    
+    text, markdown, clean_html = _parse_article_html(html_content)
+    if len(text) < FAST_PATH_MIN_TEXT_LENGTH:
+        return None
+    
+    title, metadata = _extract_page_metadata(html_content)
+    
+    # Same inputs as a Playwright extraction, so use the same date priorities
+    extracted_date, extraction_method = await extract_date_priority_system(
+        scraper_type="playwright",
+        content=markdown,
+        metadata=metadata,
+        full_html=clean_html
+    )
+    
+    logger.info(f"Date extraction method used: {extraction_method}")
+    
+    return {
+        "title": title,
+        "text": text,
+        "markdown": markdown,
+        "metadata": metadata,
+        "clean_html": clean_html,
+        "date": extracted_date.isoformat() if extracted_date else None,
+        "scraper_type": "http",
+        "date_extraction_method": extraction_method
+    }
 
-async def extract_content_with_playwright(url: str) -> Dict[str, Any]:
+async def extract_content_with_playwright(url: str) -> ExtractResult:
     """
     Extract content from a URL using Playwright and Readability.
     
@@ -88,82 +351,84 @@ async def extract_content_with_playwright(url: str) -> Dict[str, Any]:
     Raises:
         RuntimeError: If content extraction fails
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        context = await browser.new_context(ignore_https_errors=True)  # Ignore SSL certificate errors
-        page = await context.new_page()
-        
-        try:
+    try:
+        async with playwright_pool.page() as page:
+            # Only the DOM is needed, so skip images, fonts, CSS and trackers
+            await block_heavy_resources(page)
+            
             logger.info(f"Navigating to {url} with Playwright")
-            await page.goto(url, timeout=3000)  # 3 second timeout
+            # The article DOM is ready at DOMContentLoaded; don't wait for every subresource
+            await page.goto(url, timeout=12000, wait_until="domcontentloaded")  # 12 second timeout
             
             # Extract metadata
             title = await page.title()
-            metadata = {}
             
-            # Extract all meta tags
-            meta_elements = await page.query_selector_all('meta')
-            for meta in meta_elements:
-                name = await meta.get_attribute('name') 
-                property = await meta.get_attribute('property')
-                content = await meta.get_attribute('content')
-                
-                if content:
-                    key = name or property
-                    if key:
-                        metadata[key] = content
+            # Extract all meta tags in a single round-trip to the browser
+            metadata = await page.evaluate(_META_TAGS_JS)
             
             # Get HTML content for Readability and AI analysis
             html_content = await page.content()
-            doc = Document(html_content)
-            
-            # Extract main content
-            content = doc.summary()
-            
-            # Convert to both plain text and markdown
-            text = re.sub('<[^<]+?>', ' ', content).strip()
-            text = re.sub(r'\s+', ' ', text)
-            
-            markdown = convert_to_markdown(content)
-            
-            # Clean HTML for AI analysis (remove header/footer/nav elements)
-            clean_html = clean_html_for_ai(content)
-            
-            await browser.close()
-            
-            # Use the new date extraction priority system
-            extracted_date, extraction_method = await extract_date_priority_system(
-                scraper_type="playwright",
-                content=markdown,
-                metadata=metadata,
-                full_html=clean_html
-            )
-            
-            logger.info(f"Date extraction method used: {extraction_method}")
-            
-            return {
-                "title": title,
-                "text": text,
-                "markdown": markdown,
-                "metadata": metadata,
-                "clean_html": clean_html,
-                "date": extracted_date.isoformat() if extracted_date else None,
-                "scraper_type": "playwright",
-                "date_extraction_method": extraction_method
-            }
-        except PlaywrightError as e:
-            await browser.close()
-            logger.warning(f"Playwright extraction failed for {url}: {str(e)}")
-            raise RuntimeError(f"Playwright extraction failed: {str(e)}")
-        except Exception as e:
-            await browser.close()
-            logger.warning(f"Content extraction failed for {url}: {str(e)}")
-            raise RuntimeError(f"Content extraction failed: {str(e)}")
+        
+        # The page is back in the pool before the parsing and AI work below
+        text, markdown, clean_html = _parse_article_html(html_content)
+        
+        # Use the new date extraction priority system
+        extracted_date, extraction_method = await extract_date_priority_system(
+            scraper_type="playwright",
+            content=markdown,
+            metadata=metadata,
+            full_html=clean_html
+        )
+        
+        logger.info(f"Date extraction method used: {extraction_method}")
+        
+        return {
+            "title": title,
+            "text": text,
+            "markdown": markdown,
+            "metadata": metadata,
+            "clean_html": clean_html,
+            "date": extracted_date.isoformat() if extracted_date else None,
+            "scraper_type": "playwright",
+            "date_extraction_method": extraction_method
+        }
+    except PlaywrightError as e:
+        logger.warning(f"Playwright extraction failed for {url}: {str(e)}")
+        raise RuntimeError(f"Playwright extraction failed: {str(e)}")
+    except Exception as e:
+        logger.warning(f"Content extraction failed for {url}: {str(e)}")
+        raise RuntimeError(f"Content extraction failed: {str(e)}")
 
-async def extract_content(url: str) -> Dict[str, Any]:
+async def extract_content(url: str) -> ExtractResult:
     """
     Extract content from a URL, with fallback to Diffbot.
     
+    Successful results are cached by canonical URL for EXTRACT_CACHE_TTL seconds.
+    
+    Args:
+        url: The URL to extract content from
+        
+    Returns:
+        Dictionary with extracted title, text, markdown, metadata, clean_html and date
+        
+    Raises:
+        FilteredUrlError: If the URL is filtered as an obvious non-article
+        RuntimeError: If content extraction fails with all methods
+    """
+    cache_key = canonicalize_url(url)
+    cached = _EXTRACT_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info(f"Using cached extraction for {url}")
+        return ExtractResult(**cached)
+    
+    result = await _extract_content_uncached(url)
+    _EXTRACT_CACHE[cache_key] = result
+    return ExtractResult(**result)
+
+async def _extract_content_uncached(url: str) -> ExtractResult:
+    """
+    Extract content from a URL with a plain HTTP GET, then Playwright, then Diffbot.
+    
     Args:
         url: The URL to extract content from
         
@@ -171,8 +436,24 @@ async def extract_content(url: str) -> Dict[str, Any]:
         Dictionary with extracted title, text, markdown, metadata, clean_html and date
         
     Raises:
-        RuntimeError: If content extraction fails with both methods
+        FilteredUrlError: If the URL is filtered as an obvious non-article
+        RuntimeError: If content extraction fails with all methods
     """
+    # Never launch a browser for feeds, API endpoints and other obvious non-articles
+    if not is_meaningful_content({}, url):
+        raise FilteredUrlError(f"URL filtered as non-article: {url}")
+    
+    if config.ENABLE_HTTP_FAST_PATH:
+        try:
+            result = await extract_content_with_http(url)
+        except NonHtmlContentError:
+            raise
+        except Exception as e:
+            logger.warning(f"HTTP fast path error for {url}: {str(e)}")
+            result = None
+        if result:
+            return result
+    
     try:
         return await extract_content_with_playwright(url)
     except Exception as e:
@@ -180,16 +461,11 @@ async def extract_content(url: str) -> Dict[str, Any]:
         try:
             diffbot_data = await fetch_via_diffbot_async(url)
             
-            # Convert Diffbot's HTML to markdown
-            html_content = diffbot_data.get("html", "")
-            markdown = convert_to_markdown(html_content)
+            # Convert Diffbot's HTML to markdown and clean HTML for AI analysis
+            html_text, markdown, clean_html = summarize(diffbot_data.get("html", ""))
             
-            # Convert to plain text
-            text = re.sub('<[^<]+?>', ' ', html_content).strip()
-            text = re.sub(r'\s+', ' ', text)
-            
-            # Clean HTML for AI analysis
-            clean_html = clean_html_for_ai(html_content)
+            # Diffbot already returns the article text; derive it only if missing
+            text = diffbot_data.get("text") or html_text
             
             # Use the new date extraction priority system for Diffbot
             extracted_date, extraction_method = await extract_date_priority_system(
@@ -216,46 +492,6 @@ async def extract_content(url: str) -> Dict[str, Any]:
             logger.error(f"Both extraction methods failed for {url}: {str(e)}, Diffbot: {str(diffbot_error)}")
             raise RuntimeError(f"Content extraction failed with both methods: {str(diffbot_error)}")
 
-def canonicalize_url(url: str) -> str:
-    """Canonicalize a URL by normalizing various components."""
-    # Parse URL
-    parsed = urlparse(url)
-    
-    # Convert scheme and netloc to lowercase
-    scheme = parsed.scheme.lower()
-    netloc = parsed.netloc.lower()
-    
-    # Remove www.
-    if netloc.startswith('www.'):
-        netloc = netloc[4:]
-    
-    # Parse query parameters
-    query_params = parse_qs(parsed.query)
-    
-    # Remove tracking parameters (common ones)
-    tracking_params = {'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 
-                      'fbclid', 'gclid', '_ga', 'ref', 'source'}
-    query_params = {k: v for k, v in query_params.items() if k.lower() not in tracking_params}
-    
-    # Rebuild query string
-    query_items = []
-    for key in sorted(query_params.keys()):  # Sort for consistency
-        for value in sorted(query_params[key]):  # Sort values too
-            query_items.append(f"{key}={value}")
-    query = '&'.join(query_items)
-    
-    # Remove fragment
-    fragment = ''
-    
-    # Remove trailing slash from path
-    path = parsed.path.rstrip('/')
-    if not path:
-        path = '/'
-    
-    # Rebuild URL
-    canonical = urlunparse((scheme, netloc, path, '', query, fragment))
-    return canonical 
-
 def is_meaningful_content(content: Dict[str, Any], url: str) -> bool:
     """
     Check if content should be processed based on URL patterns only.
@@ -268,23 +504,20 @@ def is_meaningful_content(content: Dict[str, Any], url: str) -> bool:
     Returns:
         True if content should be sent to AI classification, False for obvious non-news URLs
     """
-    # Use enhanced URL validation from url_utils
-    from headline_worker.modules.url_utils import is_valid_article_url
+    parsed = urlparse(url)
     
     # For content filtering, we create a dummy base_url from the url itself
     # since we're checking if this single URL should be processed
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         
         # Use the enhanced URL validation logic
         if not is_valid_article_url(url, base_url):
-            logger.debug(f"URL filtered by enhanced validation: {url}")
+            logger.debug("URL filtered by enhanced validation: %s", url)
             return False
             
     except Exception as e:
-        logger.debug(f"Error in enhanced URL validation for {url}: {str(e)}")
+        logger.debug("Error in enhanced URL validation for %s: %s", url, e)
         # Fall back to basic filtering if enhanced validation fails
         pass
     
@@ -292,37 +525,16 @@ def is_meaningful_content(content: Dict[str, Any], url: str) -> bool:
     url_lower = url.lower()
     
     # Domain-level filtering for obvious non-news sites
-    from urllib.parse import urlparse
-    domain = urlparse(url_lower).netloc.replace('www.', '')
-    
-    non_news_domains = [
-        'apps.apple.com', 'play.google.com', 'chrome.google.com',
-        'itunes.apple.com', 'music.apple.com',
-        'github.com', 'gitlab.com', 'bitbucket.org',
-        'linkedin.com', 'instagram.com', 'pinterest.com',
-        'youtube.com', 'youtu.be', 'vimeo.com',
-        'amazon.com', 'ebay.com', 'etsy.com',
-        'wikipedia.org', 'wikimedia.org'
-    ]
-    
-    if any(domain.endswith(non_domain) or domain == non_domain for non_domain in non_news_domains):
-        logger.debug(f"Domain matches obvious non-news site: {domain}")
+    domain = parsed.netloc.lower().removeprefix('www.')
+    
+    if _NON_NEWS_DOMAIN_RE.search(domain):
+        logger.debug("Domain matches obvious non-news site: %s", domain)
         return False
     
-    # URL path patterns for obvious non-news content and RSS feeds
-    non_news_patterns = [
-        '/privacy-policy', '/privacy', '/terms-of-service', '/terms', 
-        '/contact-us', '/contact', '/about-us', '/about',
-        '/advertise-with-us', '/advertise',
-        '/sitemap', '/robots.txt', '.xml', '.json',
-        '/feed', '/rss', '/feeds/', '.rss', '.atom',  # RSS/Atom feeds
-        '/api/', '/wp-json/', '/xmlrpc.php'  # API endpoints
-    ]
-    
-    if any(pattern in url_lower for pattern in non_news_patterns):
-        logger.debug(f"URL matches obvious non-news pattern (including feeds): {url}")
+    if _NON_NEWS_PATH_RE.search(url_lower):
+        logger.debug("URL matches obvious non-news pattern (including feeds): %s", url)
         return False
     
     # Everything else goes to AI classification - let AI decide what's news
-    logger.debug(f"Content will be sent to extraction and AI classification: {url}")
+    logger.debug("Content will be sent to extraction and AI classification: %s", url)
     return True 
\ No newline at end of file
@@ -1,17 +1,133 @@
 """Date extraction module with priority hierarchy for different scraper types."""
+import functools
 import logging
 import json
 import re
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import openai
-import traceback
-from dateutil import parser
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from lxml import etree, html as lxml_html
 
-import config
+from headline_worker.metrics import AI_DATE_CALLS_AVOIDED
+from headline_worker.modules.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
+class DateMethod(StrEnum):
+    """
+    How an article's date was found.
+    
+    Members are str subclasses, so they compare equal to, log as and
+    serialize to the same tags stored in job payloads.
+    """
+    DIFFBOT_PRIMARY = "diffbot_primary"
+    DIFFBOT_METADATA_FALLBACK = "diffbot_metadata_fallback"
+    DIFFBOT_AI_FALLBACK = "diffbot_ai_fallback"
+    PLAYWRIGHT_METADATA_PRIMARY = "playwright_metadata_primary"
+    PLAYWRIGHT_AI_FALLBACK = "playwright_ai_fallback"
+    FAILED = "failed"
+
+# dateutil's parser module, imported on first use
+_parser = None
+
+def _lazy_parser():
+    """Import dateutil.parser the first time a date needs the generic parser"""
+    global _parser
+    if _parser is None:
+        from dateutil import parser
+        _parser = parser
+    return _parser
+
+# Common metadata date fields, in order of preference
+METADATA_DATE_FIELDS = [
+    'article:published_time',
+    'og:published_time', 
+    'date',
+    'pubdate',
+    'published',
+    'publication_date',
+    'datePublished',
+    'article:modified_time',
+    'og:updated_time',
+    'last-modified',
+    'modified'
+]
+
+# Range of plausible publication dates
+MAX_DATE_AGE = timedelta(days=3650)
+MAX_FUTURE_DATE_SKEW = timedelta(days=1)
+
+_DATE_FIELD_PRIORITY = {field: priority for priority, field in enumerate(METADATA_DATE_FIELDS)}
+
+# Article text sent to the AI date extractor: the opening characters, plus a
+# window around the first later mention of a publication date
+AI_DATE_HEAD_CHARS = 1000
+AI_DATE_HINT_WINDOW = 1000
+_DATE_HINT_RE = re.compile(r'published|posted|updated|date', re.IGNORECASE)
+
+# Relative dates returned by the AI, e.g. "2 hours ago", "yesterday"
+_RE_RELATIVE_DATE = re.compile(
+    r'(\d+)\s*(minute|hour|day|week)s?\s*ago|\b(yesterday|today)\b',
+    re.IGNORECASE
+)
+_RELATIVE_UNITS = {'minute': 'minutes', 'hour': 'hours', 'day': 'days', 'week': 'weeks'}
+
+@functools.lru_cache(maxsize=4096)
+def parse_date_string(date_str: str) -> datetime:
+    """
+    Parse a date string, trying the known ISO 8601 and RFC 1123 formats before dateutil.
+    
+    Results are memoized, since the same date strings recur across a crawl.
+    
+    Args:
+        date_str: Date string from article metadata or Diffbot
+        
+    Returns:
+        Parsed datetime object
+        
+    Raises:
+        ValueError: If the string cannot be parsed as a date
+    """
+    date_str = date_str.strip()
+    
+    # ISO 8601 (most metadata fields); C implementation, handles a trailing "Z" natively
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    
+    # RFC 1123, e.g. Diffbot's "Thu, 29 May 2025 11:15:17 GMT"
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        pass
+    
+    return _lazy_parser().parse(date_str)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_fuzzy_date(date_str: str) -> datetime:
+    """Memoized fuzzy dateutil parse for free-form AI-extracted date strings"""
+    return _lazy_parser().parse(date_str, fuzzy=True)
+
+def _is_reasonable_date(parsed_date: datetime, now: datetime) -> bool:
+    """
+    Check that a date is at most 10 years old and at most 1 day in the future.
+    
+    Args:
+        parsed_date: The date to check, naive or timezone-aware
+        now: Naive local time from a single datetime.now() call
+        
+    Returns:
+        True if the date is within range
+    """
+    if parsed_date.tzinfo:
+        # Same instant as now, expressed in the parsed date's timezone
+        now = now.astimezone(parsed_date.tzinfo)
+    
+    # Allow dates up to 1 day in future (for timezone differences) and 10 years in past
+    return now - MAX_DATE_AGE <= parsed_date <= now + MAX_FUTURE_DATE_SKEW
+
 def parse_diffbot_date(date_str: str) -> Optional[datetime]:
     """
     Parse Diffbot's date format: "Thu, 29 May 2025 11:15:17 GMT"
@@ -25,18 +141,11 @@ def parse_diffbot_date(date_str: str) -> Optional[datetime]:
     try:
         # Handle Diffbot's specific GMT format
         if date_str:
-            # Use dateutil parser which is more flexible
-            parsed_date = parser.parse(date_str)
+            # Fast path for RFC 1123, with dateutil as the fallback
+            parsed_date = parse_date_string(date_str)
             
             # Validate date is reasonable (not too far in future or past)
-            now = datetime.now(parsed_date.tzinfo if parsed_date.tzinfo else None)
-            
-            # Allow dates up to 1 day in future (for timezone differences)
-            max_future = now + timedelta(days=1)
-            # Allow dates up to 10 years in past
-            min_past = now - timedelta(days=3650)
-            
-            if min_past <= parsed_date <= max_future:
+            if _is_reasonable_date(parsed_date, datetime.now()):
                 return parsed_date
             else:
                 logger.warning(f"Date {parsed_date} is outside reasonable range")
@@ -56,111 +165,126 @@ def extract_date_from_metadata(metadata: Dict[str, Any]) -> Optional[datetime]:
     Returns:
         Parsed datetime object or None if not found
     """
-    # Common date fields to check in order of preference
-    date_fields = [
-        'article:published_time',
-        'og:published_time', 
-        'date',
-        'pubdate',
-        'published',
-        'publication_date',
-        'datePublished',
-        'article:modified_time',
-        'og:updated_time',
-        'last-modified',
-        'modified'
-    ]
+    # Only the date fields this page actually has, in order of preference
+    candidates = sorted(
+        (_DATE_FIELD_PRIORITY[field], field, value)
+        for field, value in metadata.items()
+        if value and field in _DATE_FIELD_PRIORITY
+    )
     
-    for field in date_fields:
-        if field in metadata and metadata[field]:
-            try:
-                parsed_date = parser.parse(metadata[field])
-                
-                # Validate date is reasonable
-                now = datetime.now(parsed_date.tzinfo if parsed_date.tzinfo else None)
-                max_future = now + timedelta(days=1)
-                min_past = now - timedelta(days=3650)
+    # One clock reading for every candidate
+    now = datetime.now()
+    
+    for _, field, value in candidates:
+        try:
+            parsed_date = parse_date_string(value)
+            
+            # Validate date is reasonable
+            if _is_reasonable_date(parsed_date, now):
+                logger.info(f"Extracted date from metadata field '{field}': {parsed_date}")
+                return parsed_date
                 
-                if min_past <= parsed_date <= max_future:
-                    logger.info(f"Extracted date from metadata field '{field}': {parsed_date}")
-                    return parsed_date
-                    
-            except Exception as e:
-                logger.debug(f"Failed to parse date from metadata field '{field}': {str(e)}")
-                continue
+        except Exception as e:
+            logger.debug(f"Failed to parse date from metadata field '{field}': {str(e)}")
+            continue
     
     return None
 
-async def extract_date_with_ai(content: str, metadata: Dict[str, Any], full_html: str = None) -> Optional[str]:
+def _html_to_text(html_content: Optional[str]) -> str:
+    """Get the text of an HTML fragment, or an empty string"""
+    if not html_content or not html_content.strip():
+        return ""
+    try:
+        return lxml_html.fromstring(html_content).text_content()
+    except (etree.ParserError, ValueError):
+        return ""
+
+def _date_hotspots(text: str) -> str:
     """
-    Extract date using AI analysis of content and metadata.
+    Cut article text down to the parts most likely to hold its publication date.
+    
+    Args:
+        text: Article text or markdown
+        
+    Returns:
+        The opening AI_DATE_HEAD_CHARS characters, plus a window around the first
+        later "published/posted/updated/date" mention if there is one
+    """
+    head = text[:AI_DATE_HEAD_CHARS]
+    hint = _DATE_HINT_RE.search(text, AI_DATE_HEAD_CHARS)
+    if not hint:
+        return head
+    
+    start = max(AI_DATE_HEAD_CHARS, hint.start() - AI_DATE_HINT_WINDOW // 2)
+    return f"{head}\n...\n{text[start:start + AI_DATE_HINT_WINDOW]}"
+
+def _build_date_request(content: str, metadata: Dict[str, Any], full_html: str = None) -> Dict[str, Any]:
+    """
+    Build the chat completion parameters for AI date extraction.
     
     Args:
         content: Article content (markdown)
         metadata: Article metadata
-        full_html: Full HTML content of the article (clean, no header/footer)
+        full_html: Clean HTML of the article, only used (as text) when content is empty
         
     Returns:
-        Date string as found in content or None if not found
+        Keyword arguments for chat.completions.create
     """
-    try:
-        client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
-        
-        # Format metadata as string
-        metadata_str = "\n".join(f"{k}: {v}" for k, v in metadata.items())
-        
-        # Prepare content for AI analysis - use HTML if available, otherwise markdown
-        content_for_analysis = full_html if full_html else content
-        # Limit content size to avoid token limits
-        content_for_analysis = content_for_analysis[:8000]
-        
-        prompt = f"""Extract the publication date from this news article. Look for the exact date when this article was published.
+    # Only the metadata fields that can hold a date
+    metadata_str = "\n".join(
+        f"{field}: {metadata[field]}" for field in METADATA_DATE_FIELDS if metadata.get(field)
+    ) or "(none)"
+    
+    # Prepare content for AI analysis - markdown is far cheaper in tokens than HTML
+    content_for_analysis = _date_hotspots(content or _html_to_text(full_html))
+    
+    prompt = f"""Find this news article's publication date (not dates of events it mentions). Check the metadata first, then bylines, "Published/Posted" lines, datelines and relative dates like "2 hours ago".
+
+Reply with JSON: {{"date": "<date exactly as written>"}}, or {{"date": null}} if there is none.
 
 METADATA:
 {metadata_str}
 
 ARTICLE CONTENT:
-{content_for_analysis}
-
-INSTRUCTIONS:
-1. First check the metadata for date fields like 'date', 'article:published_time', 'pubdate', etc.
-2. If not in metadata, search the article content for publication date indicators:
-   - Look in bylines (author lines) for dates
-   - Look for "Published on", "Posted on", "Date:", etc.
-   - Look for timestamps near the article title or author
-   - Check for relative dates like "2 hours ago", "yesterday" and convert them
-   - Look for datelines at the start of articles (city, date format)
-3. Prioritize publication dates over event dates mentioned in the article
-4. If you find multiple dates, choose the one that appears to be the publication date
-
-Return ONLY the date string exactly as you find it in the content. Do not reformat it.
-If no publication date can be found after thorough search, return "Date not found".
+{content_for_analysis}"""
 
-Examples of good responses:
-- "June 15, 2024"
-- "2024-06-15T10:30:00Z"
-- "Published: Dec 1, 2023"
-- "Date not found"
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": "You extract publication dates from news articles."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.1,
+        "max_tokens": 50,
+        "response_format": {"type": "json_object"}
+    }
 
-Date found:"""
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are an expert at extracting publication dates from news articles. You analyze both metadata and content to find when an article was published."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=100
-        )
+def _parse_date_reply(reply: str) -> Optional[str]:
+    """Pull the date string out of the model's JSON reply"""
+    result = json.loads(reply).get("date")
+    logger.debug(f"AI date extraction result: {result}")
+    
+    if not result or not isinstance(result, str):
+        return None
         
-        result = response.choices[0].message.content.strip()
-        logger.debug(f"AI date extraction result: {result}")
+    return result.strip()
+
+async def extract_date_with_ai(content: str, metadata: Dict[str, Any], full_html: str = None) -> Optional[str]:
+    """
+    Extract date using AI analysis of content and metadata.
+    
+    Args:
+        content: Article content (markdown)
+        metadata: Article metadata
+        full_html: Clean HTML of the article, only used (as text) when content is empty
         
-        if result == "Date not found" or not result:
-            return None
-            
-        return result
+    Returns:
+        Date string as found in content or None if not found
+    """
+    try:
+        client = get_openai_client()
+        response = await client.chat.completions.create(**_build_date_request(content, metadata, full_html))
+        return _parse_date_reply(response.choices[0].message.content)
         
     except Exception as e:
         logger.error(f"AI date extraction failed: {str(e)}")
@@ -180,38 +304,23 @@ def parse_ai_extracted_date(date_str: str) -> Optional[datetime]:
         # Clean up the date string
         date_str = date_str.strip()
         
-        # Handle relative dates like "2 hours ago", "yesterday"
+        # Handle relative dates like "2 hours ago", "yesterday" in a single scan
         now = datetime.now()
-        lower_str = date_str.lower()
+        relative_match = _RE_RELATIVE_DATE.search(date_str)
         
-        if "hour" in lower_str and "ago" in lower_str:
-            # Extract hours from "2 hours ago"
-            hours_match = re.search(r'(\d+)\s*hours?\s*ago', lower_str)
-            if hours_match:
-                hours = int(hours_match.group(1))
-                return now - timedelta(hours=hours)
-                
-        elif "day" in lower_str and "ago" in lower_str:
-            # Extract days from "2 days ago"
-            days_match = re.search(r'(\d+)\s*days?\s*ago', lower_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return now - timedelta(days=days)
-                
-        elif "yesterday" in lower_str:
-            return now - timedelta(days=1)
-            
-        elif "today" in lower_str:
+        if relative_match:
+            count, unit, day_word = relative_match.groups()
+            if unit:
+                return now - timedelta(**{_RELATIVE_UNITS[unit.lower()]: int(count)})
+            if day_word.lower() == "yesterday":
+                return now - timedelta(days=1)
             return now.replace(hour=12, minute=0, second=0, microsecond=0)
         
         # Try to parse with dateutil
-        parsed_date = parser.parse(date_str, fuzzy=True)
+        parsed_date = _parse_fuzzy_date(date_str)
         
         # Validate date is reasonable
-        max_future = now + timedelta(days=1)
-        min_past = now - timedelta(days=3650)
-        
-        if min_past <= parsed_date <= max_future:
+        if _is_reasonable_date(parsed_date, now):
             return parsed_date
         else:
             logger.warning(f"AI extracted date {parsed_date} is outside reasonable range")
@@ -227,7 +336,7 @@ async def extract_date_priority_system(
     content: str = None,
     metadata: Dict[str, Any] = None,
     full_html: str = None
-) -> Tuple[Optional[datetime], str]:
+) -> Tuple[Optional[datetime], "DateMethod"]:
     """
     Extract date using priority system based on scraper type.
     
@@ -239,7 +348,7 @@ async def extract_date_priority_system(
         full_html: Clean HTML content (no header/footer)
         
     Returns:
-        Tuple of (datetime object, method used) or (None, "failed")
+        Tuple of (datetime object, method used) or (None, DateMethod.FAILED)
     """
     
     if scraper_type == "diffbot":
@@ -249,34 +358,43 @@ async def extract_date_priority_system(
             parsed_date = parse_diffbot_date(diffbot_data["date"])
             if parsed_date:
                 logger.info(f"Successfully extracted date from Diffbot: {parsed_date}")
-                return parsed_date, "diffbot_primary"
+                return parsed_date, DateMethod.DIFFBOT_PRIMARY
         
-        # Fallback: AI extraction with metadata + content
+        # Fallback: Algorithmic metadata extraction (no AI call needed)
+        if metadata:
+            parsed_date = extract_date_from_metadata(metadata)
+            if parsed_date:
+                logger.info(f"Successfully extracted date with metadata fallback: {parsed_date}")
+                AI_DATE_CALLS_AVOIDED.inc()
+                return parsed_date, DateMethod.DIFFBOT_METADATA_FALLBACK
+        
+        # Last resort: AI extraction with metadata + content
         if content and metadata:
             ai_date_str = await extract_date_with_ai(content, metadata, full_html)
             if ai_date_str:
                 parsed_date = parse_ai_extracted_date(ai_date_str)
                 if parsed_date:
                     logger.info(f"Successfully extracted date with AI fallback: {parsed_date}")
-                    return parsed_date, "diffbot_ai_fallback"
+                    return parsed_date, DateMethod.DIFFBOT_AI_FALLBACK
     
     elif scraper_type == "playwright":
         # PLAYWRIGHT PRIORITY SYSTEM
-        # Primary: AI extraction with metadata + content
+        # Primary: Algorithmic metadata extraction (no AI call needed)
+        if metadata:
+            parsed_date = extract_date_from_metadata(metadata)
+            if parsed_date:
+                logger.info(f"Successfully extracted date from metadata: {parsed_date}")
+                AI_DATE_CALLS_AVOIDED.inc()
+                return parsed_date, DateMethod.PLAYWRIGHT_METADATA_PRIMARY
+        
+        # Fallback: AI extraction with metadata + content
         if content and metadata:
             ai_date_str = await extract_date_with_ai(content, metadata, full_html)
             if ai_date_str:
                 parsed_date = parse_ai_extracted_date(ai_date_str)
                 if parsed_date:
-                    logger.info(f"Successfully extracted date with AI primary: {parsed_date}")
-                    return parsed_date, "playwright_ai_primary"
-        
-        # Fallback: Algorithmic metadata extraction
-        if metadata:
-            parsed_date = extract_date_from_metadata(metadata)
-            if parsed_date:
-                logger.info(f"Successfully extracted date with algorithmic fallback: {parsed_date}")
-                return parsed_date, "playwright_algorithmic_fallback"
+                    logger.info(f"Successfully extracted date with AI fallback: {parsed_date}")
+                    return parsed_date, DateMethod.PLAYWRIGHT_AI_FALLBACK
     
     logger.warning(f"Failed to extract date using {scraper_type} priority system - this may be expected for non-news content")
-    return None, "failed" 
\ No newline at end of file
+    return None, DateMethod.FAILED
\ No newline at end of file
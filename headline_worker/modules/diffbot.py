@@ -1,14 +1,12 @@
 """Diffbot API client for the headline content scraper."""
 import logging
-import itertools
-import time
-import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import asyncio
 import aiohttp
+import orjson
 
-import config
 from headline_worker.metrics import DIFFBOT_REQUESTS, DIFFBOT_RATE_LIMITS
+from headline_worker.modules.http_session import get_diffbot_session
 from headline_worker.modules.link_collector import diffbot_key_manager
 
 logger = logging.getLogger(__name__)
@@ -26,38 +24,39 @@ async def fetch_via_diffbot_async(url: str) -> Dict[str, Any]:
     Raises:
         RuntimeError: If the request fails
     """
-    # Get a key from the key manager (respects rate limits)
-    token = await diffbot_key_manager.get_key()
+    # Get a key from the key manager (respects rate limits); only wait when all keys are busy
+    token = diffbot_key_manager.get_key_nowait() or await diffbot_key_manager.get_key()
     
     try:
         DIFFBOT_REQUESTS.inc()
         logger.info(f"Fetching {url} via Diffbot (key: {token[:5]}...)")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.diffbot.com/v3/article",
-                params={"token": token, "url": url},
-                timeout=15
-            ) as resp:
-                if resp.status == 429:  # quota exceeded
-                    logger.warning(f"Diffbot key {token[:5]}... quota exceeded")
-                    DIFFBOT_RATE_LIMITS.inc()
-                    raise RuntimeError(f"Diffbot key {token[:5]}... quota exceeded")
-                    
-                if resp.status == 403:  # forbidden
-                    logger.warning(f"Diffbot key {token[:5]}... forbidden")
-                    raise RuntimeError(f"Diffbot key {token[:5]}... forbidden")
-                    
-                if resp.status != 200:
-                    raise RuntimeError(f"Diffbot returned status {resp.status}")
+        session = await get_diffbot_session()
+        async with session.get(
+            "https://api.diffbot.com/v3/article",
+            params={"token": token, "url": url},
+            timeout=aiohttp.ClientTimeout(total=15)
+        ) as resp:
+            if resp.status == 429:  # quota exceeded
+                logger.warning(f"Diffbot key {token[:5]}... quota exceeded")
+                DIFFBOT_RATE_LIMITS.inc()
+                raise RuntimeError(f"Diffbot key {token[:5]}... quota exceeded")
                 
-                data = await resp.json()
+            if resp.status == 403:  # forbidden
+                logger.warning(f"Diffbot key {token[:5]}... forbidden")
+                raise RuntimeError(f"Diffbot key {token[:5]}... forbidden")
                 
-                if data.get("objects"):
-                    return data["objects"][0]  # title, text, date
-                    
-                logger.warning(f"Diffbot returned no objects for {url}")
-                raise RuntimeError(f"Diffbot returned no objects for {url}")
+            if resp.status != 200:
+                raise RuntimeError(f"Diffbot returned status {resp.status}")
+            
+            # orjson decodes the raw bytes directly, skipping the str decode and stdlib json
+            data = orjson.loads(await resp.read())
+            
+            if data.get("objects"):
+                return data["objects"][0]  # title, text, date
+                
+            logger.warning(f"Diffbot returned no objects for {url}")
+            raise RuntimeError(f"Diffbot returned no objects for {url}")
     except asyncio.TimeoutError:
         logger.warning(f"Diffbot request timed out for {url}")
         raise RuntimeError(f"Diffbot request timed out for {url}")
@@ -1,40 +1,49 @@
 """Module for handling article embedding operations."""
+import functools
 import logging
 import asyncio
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 
 import config
 
 # Only import pinecone if embeddings are enabled
 Pinecone = None
 if config.ENABLE_EMBEDDINGS:
-try:
-    # Try importing using new syntax
-    from pinecone import Pinecone
-except (ImportError, Exception) as e:
-    # Fall back to older pinecone-client way
     try:
-        from pinecone import Pinecone, Index
-        logger = logging.getLogger(__name__)
-        logger.info("Using pinecone-client with Pinecone() constructor")
-    except ImportError:
+        # Try importing using new syntax
+        from pinecone import Pinecone
+    except (ImportError, Exception) as e:
+        # Fall back to older pinecone-client way
+        try:
+            from pinecone import Pinecone, Index
+            logger = logging.getLogger(__name__)
+            logger.info("Using pinecone-client with Pinecone() constructor")
+        except ImportError:
             # If that fails too, log warning but don't crash
-        logger = logging.getLogger(__name__)
+            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to import pinecone: {str(e)}. Embeddings will be disabled.")
             Pinecone = None
 
-import openai
 from headline_worker.metrics import ARTICLES_EMBEDDED
+from headline_worker.modules.micro_batcher import MicroBatcher
+from headline_worker.modules.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
-# Semaphore to limit concurrent embedding requests
-embedding_semaphore = asyncio.Semaphore(5)
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 96  # texts per embeddings request
+EMBEDDING_MAX_WAIT = 0.05  # seconds to wait for a batch to fill
+PINECONE_UPSERT_BATCH_SIZE = 100  # Pinecone's per-request vector limit
 
-# Global Pinecone client instance
+# Semaphore to limit concurrent embedding requests (each carries a whole batch)
+embedding_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_EMBEDDINGS)
+
+# Global Pinecone client and index instances
 pinecone_client = None
+pinecone_index = None
 
+@functools.lru_cache(maxsize=2048)
 def prepare_embedding_text(
     title: str, 
     city: Optional[str] = None, 
@@ -75,11 +84,8 @@ def prepare_embedding_text(
             location_parts.append(state)
         parts.append(f"[LOCATION]: {', '.join(location_parts)}")
     
-    # Add topics if available
-    topic_parts = []
-    for t in [main_topic, topic, topic_2, topic_3]:
-        if t and t not in topic_parts:  # Avoid duplicates
-            topic_parts.append(t)
+    # Add topics if available, dropping duplicates but keeping order
+    topic_parts = list(dict.fromkeys(t for t in (main_topic, topic, topic_2, topic_3) if t))
     
     if topic_parts:
         parts.append(f"[TOPICS]: {', '.join(topic_parts)}")
@@ -91,32 +97,61 @@ def prepare_embedding_text(
     return "\n".join(parts)
 
 def init_pinecone() -> None:
-    """Initialize Pinecone client."""
-    global pinecone_client
+    """Initialize Pinecone client and index handle."""
+    global pinecone_client, pinecone_index
     
     # Only initialize once
-    if pinecone_client is not None:
+    if pinecone_index is not None:
         return
         
     try:
         # Initialize with new API
-        pinecone_client = Pinecone(
-            api_key=config.PINECONE_API_KEY,
-            environment=config.PINECONE_ENV
-        )
+        if pinecone_client is None:
+            pinecone_client = Pinecone(
+                api_key=config.PINECONE_API_KEY,
+                environment=config.PINECONE_ENV
+            )
         
         # Create index if it doesn't exist
-        if config.PINECONE_INDEX not in pinecone_client.list_indexes().names():
+        if not config.PINECONE_ASSUME_INDEX_EXISTS and config.PINECONE_INDEX not in pinecone_client.list_indexes().names():
             pinecone_client.create_index(
                 name=config.PINECONE_INDEX,
                 dimension=1536,  # OpenAI embedding dimension
                 metric="cosine"
             )
             logger.info(f"Created Pinecone index: {config.PINECONE_INDEX}")
+        
+        pinecone_index = pinecone_client.Index(config.PINECONE_INDEX)
     except Exception as e:
         logger.error(f"Failed to check/create Pinecone index: {str(e)}")
         raise
 
+async def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Generate embeddings for several texts in a single API request.
+    
+    Args:
+        texts: The texts to embed
+        
+    Returns:
+        The embedding vectors, in the same order as texts
+        
+    Raises:
+        RuntimeError: If embedding generation fails
+    """
+    try:
+        async with embedding_semaphore:
+            client = get_openai_client()
+            response = await client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts
+            )
+            
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    except Exception as e:
+        logger.error(f"Failed to generate embeddings for {len(texts)} texts: {str(e)}")
+        raise RuntimeError(f"Failed to generate embedding: {str(e)}")
+
 async def generate_embedding(text: str) -> List[float]:
     """
     Generate embedding for text.
@@ -130,18 +165,46 @@ async def generate_embedding(text: str) -> List[float]:
     Raises:
         RuntimeError: If embedding generation fails
     """
+    vectors = await generate_embeddings_batch([text])
+    return vectors[0]
+
+async def upsert_vectors_batch(vectors: List[Tuple[str, List[float], Dict[str, Any]]]) -> List[str]:
+    """
+    Upsert several vectors to Pinecone in a single request.
+    
+    Args:
+        vectors: (vector_id, vector, metadata) tuples
+        
+    Returns:
+        The vector IDs, in the same order as vectors
+        
+    Raises:
+        RuntimeError: If upserting to Pinecone fails
+    """
     try:
-        async with embedding_semaphore:
-            client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
-            response = client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text
+        # Initialize Pinecone (no-op once the index handle exists)
+        init_pinecone()
+        
+        # The Pinecone client is synchronous, so keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: pinecone_index.upsert(
+                vectors=vectors,
+                namespace="articles"  # Use the same namespace as other codebase
             )
-            
-            return response.data[0].embedding
+        )
+        
+        # Increment metric
+        ARTICLES_EMBEDDED.inc(len(vectors))
+        
+        return [vector_id for vector_id, _, _ in vectors]
     except Exception as e:
-        logger.error(f"Failed to generate embedding: {str(e)}")
-        raise RuntimeError(f"Failed to generate embedding: {str(e)}")
+        logger.error(f"Failed to upsert {len(vectors)} vectors to Pinecone: {str(e)}")
+        raise RuntimeError(f"Failed to upsert to Pinecone: {str(e)}")
+
+# Global batchers: embeddings and upserts from concurrent articles share requests
+embedding_batcher = MicroBatcher(generate_embeddings_batch, EMBEDDING_BATCH_SIZE, EMBEDDING_MAX_WAIT)
+upsert_batcher = MicroBatcher(upsert_vectors_batch, PINECONE_UPSERT_BATCH_SIZE, EMBEDDING_MAX_WAIT)
 
 async def upsert_to_pinecone(
     article_id: int,
@@ -149,7 +212,7 @@ async def upsert_to_pinecone(
     metadata: Dict[str, Any]
 ) -> str:
     """
-    Upsert a vector to Pinecone.
+    Upsert a vector to Pinecone, batched with other concurrent upserts.
     
     Args:
         article_id: The article ID
@@ -162,31 +225,14 @@ async def upsert_to_pinecone(
     Raises:
         RuntimeError: If upserting to Pinecone fails
     """
-    try:
-        # Initialize Pinecone
-        init_pinecone()
-        
-        # Get index using the correct pattern
-        index = pinecone_client.Index(config.PINECONE_INDEX)
-        
-        # Create vector ID using article_id
-        vector_id = f"article_{article_id}"
-        
-        # Upsert vector
-        index.upsert(
-            vectors=[(vector_id, vector, metadata)],
-            namespace="articles"  # Use the same namespace as other codebase
-        )
-        
-        # Increment metric
-        ARTICLES_EMBEDDED.inc()
-        
-        logger.info(f"Upserted vector for article ID: {article_id}")
-        
-        return vector_id
-    except Exception as e:
-        logger.error(f"Failed to upsert to Pinecone: {str(e)}")
-        raise RuntimeError(f"Failed to upsert to Pinecone: {str(e)}")
+    # Create vector ID using article_id
+    vector_id = f"article_{article_id}"
+    
+    await upsert_batcher.submit((vector_id, vector, metadata))
+    
+    logger.info(f"Upserted vector for article ID: {article_id}")
+    
+    return vector_id
 
 async def embed_article(
     article_id: int,
@@ -220,21 +266,9 @@ async def embed_article(
         return
         
     try:
-        # Prepare topics
-        main_topic = None
-        topic = None
-        topic_2 = None
-        topic_3 = None
-        
-        if topics:
-            if len(topics) > 0:
-                main_topic = topics[0]
-            if len(topics) > 1:
-                topic = topics[1]
-            if len(topics) > 2:
-                topic_2 = topics[2]
-            if len(topics) > 3:
-                topic_3 = topics[3]
+        # Prepare topics (up to four, padded with None)
+        main_topic, topic, topic_2, topic_3 = (list(topics or [])[:4] + [None] * 4)[:4]
+        article_topics = [t for t in (main_topic, topic, topic_2, topic_3) if t]
         
         # Prepare embedding text
         text = prepare_embedding_text(
@@ -248,9 +282,6 @@ async def embed_article(
             summary=summary
         )
         
-        # Generate embedding
-        vector = await generate_embedding(text)
-        
         # Prepare metadata
         metadata = {
             "article_id": str(article_id),
@@ -259,10 +290,15 @@ async def embed_article(
             "summary": summary,
             "date_posted": date_posted.isoformat() if date_posted else None,
             "location": f"{city},{state}" if city and state else (city or ""),
-            "topics": [t for t in [main_topic, topic, topic_2, topic_3] if t],
-            "last_updated": datetime.utcnow().isoformat()
+            "topics": article_topics,
+            "last_updated": datetime.now(timezone.utc).isoformat(timespec="seconds")
         }
         
+        # Generate embedding, batched with other articles being embedded. Each batch
+        # is flushed as its own task, so while this article's batch is being
+        # upserted the next batch of embeddings is already in flight.
+        vector = await embedding_batcher.submit(text)
+        
         # Upsert to Pinecone
         vector_id = await upsert_to_pinecone(article_id, vector, metadata)
         
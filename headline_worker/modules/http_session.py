@@ -0,0 +1,86 @@
+"""Shared HTTP clients: the aiohttp session for Diffbot and the httpx client for plain page fetches."""
+import asyncio
+import logging
+import re
+from typing import Optional
+
+import aiohttp
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Plain page fetches made without a browser
+FAST_PATH_TIMEOUT = 8  # seconds
+FAST_PATH_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Markers of pages that only render their content with JavaScript
+JS_REQUIRED_RE = re.compile(
+    r'<noscript[^>]*>[^<]*(?:enable|requires?)\s+javascript'
+    r'|<div[^>]+id=["\'](?:root|app|__next|__nuxt)["\'][^>]*>\s*</div>',
+    re.IGNORECASE
+)
+
+# Global aiohttp session for Diffbot requests, and the event loop it belongs to
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Global HTTP client for the fast paths
+_http_client: Optional[httpx.AsyncClient] = None
+
+async def get_diffbot_session() -> aiohttp.ClientSession:
+    """
+    Get or create the shared aiohttp session for Diffbot requests.
+    
+    Reusing one session keeps connections to api.diffbot.com alive between
+    requests. A new session is created if the old one was closed or belongs
+    to a different event loop (e.g. after fetch_via_diffbot's asyncio.run).
+    Creation never awaits, so concurrent callers cannot create two sessions.
+    
+    Returns:
+        The shared aiohttp ClientSession
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        logger.info("Creating shared Diffbot HTTP session...")
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        _session_loop = loop
+    return _session
+
+async def close_diffbot_session() -> None:
+    """Close the shared Diffbot session, if it was created"""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client used by the article and link fast paths.
+    
+    Returns:
+        The shared httpx AsyncClient
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=FAST_PATH_TIMEOUT,
+            follow_redirects=True,
+            headers={"User-Agent": FAST_PATH_USER_AGENT},
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if it was created"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -2,19 +2,40 @@
 import logging
 import re
 import asyncio
-import aiohttp
 import random
 import time
-from datetime import datetime, timedelta
+from collections import deque
 from typing import List, Set
-from urllib.parse import urljoin, quote_plus
-from playwright.async_api import async_playwright, Error as PlaywrightError
+from urllib.parse import urljoin, urlsplit, quote_plus
+import httpx
+import orjson
+from cachetools import TTLCache
+from lxml import etree, html as lxml_html
+from playwright.async_api import Error as PlaywrightError
 
 import config
-from headline_worker.modules.url_utils import canonicalize_url, is_valid_article_url, NON_CONTENT_EXTENSIONS, SOCIAL_HOSTS
+from headline_worker.modules.browser_pool import block_heavy_resources, playwright_pool
+from headline_worker.modules.http_session import JS_REQUIRED_RE, get_diffbot_session, get_http_client
+from headline_worker.modules.url_utils import canonicalize_url, is_valid_article_url, NON_CONTENT_OR_SOCIAL
 
 logger = logging.getLogger(__name__)
 
+# Link collection method that last worked for each source host, tried first next time
+LINK_STRATEGY_TTL = 6 * 3600  # seconds
+_link_strategy: TTLCache = TTLCache(maxsize=10_000, ttl=LINK_STRATEGY_TTL)
+
+# A static page yielding fewer article links than this is assumed to be rendered by JavaScript
+HTTP_MIN_LINKS = 5
+
+# Anchor targets and og:url values, read in a single XPath evaluation
+_LINK_XPATH = etree.XPath('//a/@href | //meta[@property="og:url"]/@content')
+
+# Same links read in the browser; a.href is already resolved to an absolute URL
+_LINKS_JS = """() => [
+    ...Array.from(document.querySelectorAll('a[href]'), a => a.href),
+    ...Array.from(document.querySelectorAll('meta[property="og:url"]'), m => m.content)
+].filter(Boolean)"""
+
 class DiffbotKeyManager:
     """
     Smart Diffbot API key manager that tracks usage and respects rate limits.
@@ -28,24 +49,67 @@ class DiffbotKeyManager:
     def __new__(cls):
         """Singleton pattern to ensure only one key manager exists"""
         if cls._instance is None:
-            cls._instance = super(DiffbotKeyManager, cls).__new__(cls)
-            cls._instance._initialized = False
+            instance = super(DiffbotKeyManager, cls).__new__(cls)
+            
+            # Initialize eagerly: config is already loaded and nothing here awaits
+            logger.info(f"Initializing Diffbot key manager with {len(config.DIFFBOT_KEYS)} keys")
+            instance.keys = config.DIFFBOT_KEYS.copy()
+            # Initialize usage tracking - a deque of monotonic timestamps for each key, oldest first
+            instance.usage = {key: deque() for key in instance.keys}
+            cls._instance = instance
         return cls._instance
     
-    async def __init_if_needed(self):
-        """Initialize the manager if needed (with lock to ensure thread safety)"""
-        if self._initialized:
-            return
+    def _select_key(self, now: float):
+        """
+        Pick and record a key with capacity, without awaiting.
+        
+        Args:
+            now: The current time.monotonic() reading
             
-        async with self._lock:
-            if self._initialized:  # Double-check inside lock
-                return
-                
-            logger.info(f"Initializing Diffbot key manager with {len(config.DIFFBOT_KEYS)} keys")
-            self.keys = config.DIFFBOT_KEYS.copy()
-            # Initialize usage tracking - a list of timestamps for each key
-            self.usage = {key: [] for key in self.keys}
-            self._initialized = True
+        Returns:
+            The selected key, or None if every key is at its rate limit
+        """
+        one_minute_ago = now - 60.0
+        
+        # Drop entries older than 1 minute from the front of each key's window
+        for usage in self.usage.values():
+            while usage and usage[0] <= one_minute_ago:
+                usage.popleft()
+        
+        # Find the least used keys with fewer than 5 calls in the last minute in one pass
+        least_usage = 5
+        least_used_keys = []
+        for key, usage in self.usage.items():
+            count = len(usage)
+            if count < least_usage:
+                least_usage = count
+                least_used_keys = [key]
+            elif count == least_usage < 5:
+                least_used_keys.append(key)
+        
+        if not least_used_keys:
+            return None
+        
+        # Select one of the least used keys (randomly from keys with the same usage count)
+        selected_key = least_used_keys[0] if len(least_used_keys) == 1 else random.choice(least_used_keys)
+        
+        # Record this usage
+        self.usage[selected_key].append(now)
+        
+        logger.debug("Selected Diffbot key with %s recent uses", len(self.usage[selected_key]))
+        return selected_key
+    
+    def get_key_nowait(self):
+        """
+        Get a key immediately if one has capacity, without waiting on the lock.
+        
+        This runs without any await, so it is atomic with respect to other
+        coroutines and cannot interleave with get_key().
+        
+        Returns:
+            A Diffbot API key, or None if all keys are at their rate limit
+        """
+        return self._select_key(time.monotonic())
     
     async def get_key(self):
         """
@@ -55,80 +119,34 @@ class DiffbotKeyManager:
             A Diffbot API key that has capacity for a new request.
         
         Raises:
-            RuntimeError: If no keys are available within rate limits.
+            RuntimeError: If no Diffbot API keys are configured.
         """
-        await self.__init_if_needed()
+        if not self.keys:
+            raise RuntimeError("No Diffbot API keys configured")
         
-        async with self._lock:
-            now = datetime.now()
-            one_minute_ago = now - timedelta(minutes=1)
-            
-            # Update all key usage lists to remove entries older than 1 minute
-            for key in self.keys:
-                self.usage[key] = [t for t in self.usage[key] if t > one_minute_ago]
-            
-            # Find keys with fewer than 5 calls in the last minute
-            available_keys = [
-                key for key in self.keys 
-                if len(self.usage[key]) < 5
-            ]
-            
-            if not available_keys:
-                # Calculate the earliest time a key will be available
-                earliest_available = now
-                for key in self.keys:
-                    if self.usage[key]:  # If key has been used
-                        earliest = min(self.usage[key]) + timedelta(minutes=1)
-                        if earliest < earliest_available:
-                            earliest_available = earliest
-                
-                wait_seconds = (earliest_available - now).total_seconds()
-                if wait_seconds > 0:
-                    logger.warning(f"All Diffbot keys at rate limit, waiting {wait_seconds:.1f} seconds for a key to become available")
-                    # Release the lock during waiting
-                    await asyncio.sleep(wait_seconds)
-                    # Try again after waiting
-                    return await self.get_key()
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                selected_key = self._select_key(now)
+                if selected_key is not None:
+                    return selected_key
                 
-            # Sort available keys by usage count (least used first)
-            available_keys.sort(key=lambda k: len(self.usage[k]))
-            
-            # Select one of the least used keys (randomly from keys with the same usage count)
-            least_usage = len(self.usage[available_keys[0]])
-            least_used_keys = [k for k in available_keys if len(self.usage[k]) == least_usage]
-            selected_key = random.choice(least_used_keys)
-            
-            # Record this usage
-            self.usage[selected_key].append(now)
+                # The oldest use of each key is at the front of its deque
+                wait_seconds = min(usage[0] for usage in self.usage.values()) + 60.0 - now
             
-            logger.debug(f"Selected Diffbot key with {len(self.usage[selected_key])} recent uses")
-            return selected_key
+            # Sleep outside the lock so get_key_nowait() and record_usage() aren't blocked
+            if wait_seconds > 0:
+                logger.warning(f"All Diffbot keys at rate limit, waiting {wait_seconds:.1f} seconds for a key to become available")
+                await asyncio.sleep(wait_seconds)
     
     async def record_usage(self, key):
         """Record usage of a key"""
-        await self.__init_if_needed()
-        
         async with self._lock:
-            self.usage[key].append(datetime.now())
+            self.usage[key].append(time.monotonic())
 
 # Global Diffbot key manager instance
 diffbot_key_manager = DiffbotKeyManager()
 
-def is_valid_article_url(url: str, base_url: str) -> bool:
-    """
-    Check if a URL is likely to be a valid article URL.
-    
-    Args:
-        url: The URL to check
-        base_url: The base URL of the source
-        
-    Returns:
-        bool: True if the URL is likely an article, False otherwise
-    """
-    # Use the enhanced validation from url_utils
-    from headline_worker.modules.url_utils import is_valid_article_url as enhanced_is_valid_article_url
-    return enhanced_is_valid_article_url(url, base_url)
-
 async def collect_links_with_diffbot(url: str, limit: int = 100) -> List[str]:
     """
     Collect links using Diffbot's List API.
@@ -158,49 +176,126 @@ async def collect_links_with_diffbot(url: str, limit: int = 100) -> List[str]:
         
         logger.info(f"Collecting links from {url} using Diffbot List API")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(base_url, params=params, timeout=30) as response:
-                if response.status != 200:
-                    logger.error(f"Diffbot API error: {response.status} - {await response.text()}")
-                    raise RuntimeError(f"Failed to collect links: Diffbot API returned status {response.status}")
-                
-                data = await response.json()
-                
-                # Log the response for debugging
-                logger.debug(f"Diffbot response: {data}")
-                
-                if not data.get("objects"):
-                    logger.warning(f"No objects found in Diffbot response for {url}")
-                    return []
-                
-                # Extract links from the response
-                links = []
-                for item in data.get("objects", []):
-                    link = item.get("link")
-                    if link and is_valid_article_url(link, url):
-                        canonical_link = canonicalize_url(link)
-                        if canonical_link not in links:
+        session = await get_diffbot_session()
+        async with session.get(base_url, params=params) as response:
+            if response.status != 200:
+                logger.error(f"Diffbot API error: {response.status} - {await response.text()}")
+                raise RuntimeError(f"Failed to collect links: Diffbot API returned status {response.status}")
+            
+            # orjson decodes the raw bytes directly, skipping the str decode and stdlib json
+            data = orjson.loads(await response.read())
+            
+            # Log the response for debugging
+            logger.debug("Diffbot response: %s", data)
+            
+            if not data.get("objects"):
+                logger.warning(f"No objects found in Diffbot response for {url}")
+                return []
+            
+            # Extract links from the response, keeping Diffbot's order
+            links = []
+            seen = set()
+            for item in data.get("objects", []):
+                link = item.get("link")
+                if link and is_valid_article_url(link, url):
+                    canonical_link = canonicalize_url(link)
+                    if canonical_link not in seen:
+                        seen.add(canonical_link)
+                        links.append(canonical_link)
+                        logger.debug("Added link from Diffbot: %s", canonical_link)
+            
+            # Look for pagination links
+            if data.get("nextPages"):
+                for next_link in data.get("nextPages"):
+                    if len(links) >= limit:
+                        break
+                    if next_link and is_valid_article_url(next_link, url):
+                        canonical_link = canonicalize_url(next_link)
+                        if canonical_link not in seen:
+                            seen.add(canonical_link)
                             links.append(canonical_link)
-                            logger.debug(f"Added link from Diffbot: {canonical_link}")
-                
-                # Look for pagination links
-                if data.get("nextPages"):
-                    for next_link in data.get("nextPages"):
-                        if len(links) >= limit:
-                            break
-                        if next_link and is_valid_article_url(next_link, url):
-                            canonical_link = canonicalize_url(next_link)
-                            if canonical_link not in links:
-                                links.append(canonical_link)
-                                logger.debug(f"Added pagination link from Diffbot: {canonical_link}")
-                
-                logger.info(f"Found {len(links)} links using Diffbot")
-                return links[:limit]  # Respect the link limit
-    
+                            logger.debug("Added pagination link from Diffbot: %s", canonical_link)
+            
+            logger.info(f"Found {len(links)} links using Diffbot")
+            return links[:limit]  # Respect the link limit
+
     except Exception as e:
         logger.error(f"Error collecting links with Diffbot: {str(e)}")
         raise RuntimeError(f"Failed to collect links with Diffbot: {str(e)}")
 
+def _filter_links(raw_links: List[str], limit: int) -> List[str]:
+    """
+    Drop non-content links from a scraped page and canonicalize the rest.
+    
+    Args:
+        raw_links: Absolute URLs found on the page
+        limit: Maximum number of links to return
+        
+    Returns:
+        List of unique, canonicalized links
+    """
+    processed_links = set()
+    
+    # Navigation menus repeat the same anchors many times; only look at each link once
+    for link in dict.fromkeys(raw_links):
+        try:
+            # Skip invalid URLs
+            if not link or not link.startswith(('http://', 'https://')):
+                continue
+            
+            # Skip non-content URLs
+            if NON_CONTENT_OR_SOCIAL.search(link):
+                continue
+            
+            # Canonicalize the URL, only for links that survived the cheap checks above
+            canonical_link = canonicalize_url(link)
+            processed_links.add(canonical_link)
+            
+            # Stop if we've reached the limit
+            if len(processed_links) >= limit:
+                break
+        except Exception as e:
+            logger.debug("Error processing link %s: %s", link, e)
+    
+    return list(processed_links)
+
+async def collect_links_with_http(url: str, limit: int = 100) -> List[str]:
+    """
+    Collect links from the static HTML of a page, without a browser.
+    
+    Args:
+        url: The URL of the source page
+        limit: Maximum number of links to collect
+        
+    Returns:
+        List of unique, canonicalized links
+        
+    Raises:
+        RuntimeError: If the page can't be fetched or looks rendered by JavaScript
+    """
+    try:
+        response = await get_http_client().get(url)
+        response.raise_for_status()
+        html_content = response.text
+        doc = lxml_html.fromstring(html_content)
+    except (httpx.HTTPError, etree.ParserError, ValueError) as e:
+        raise RuntimeError(f"HTTP link collection failed: {str(e)}")
+    
+    # App shells often still carry their navigation links, so link counts alone miss them
+    if JS_REQUIRED_RE.search(html_content):
+        raise RuntimeError("Static HTML is a JavaScript app shell, page needs a browser")
+    
+    # Resolve against the final URL in case the source redirected
+    page_url = str(response.url)
+    links = _filter_links([urljoin(page_url, link.strip()) for link in _LINK_XPATH(doc)], limit)
+    
+    # Header and footer links don't show that the article list was rendered server-side
+    article_links = sum(1 for link in links if is_valid_article_url(link, url))
+    if article_links < HTTP_MIN_LINKS:
+        raise RuntimeError(f"Only {article_links} article links in static HTML, page likely needs JavaScript")
+    
+    return links
+
 async def collect_links_with_playwright(url: str, limit: int = 100) -> List[str]:
     """
     Collect links using Playwright.
@@ -215,101 +310,64 @@ async def collect_links_with_playwright(url: str, limit: int = 100) -> List[str]
     Raises:
         RuntimeError: If link collection fails
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
+    # Pages come from the worker's shared browser instead of launching Chromium per source
+    async with playwright_pool.page() as page:
+        # Links are in the DOM; skip images, fonts, CSS and trackers
+        await block_heavy_resources(page)
         
-        try:
-            logger.info(f"Collecting links from {url} using Playwright")
-            await page.goto(url, timeout=10000)  # 10 second timeout
-            
-            # Collect links from a elements
-            link_elements = await page.query_selector_all('a[href]')
-            raw_links = []
-            
-            for link_element in link_elements:
-                href = await link_element.get_attribute('href')
-                if href:
-                    # Convert to absolute URL
-                    abs_url = urljoin(url, href)
-                    raw_links.append(abs_url)
-            
-            # Also check for og:url meta tags
-            og_url_elements = await page.query_selector_all('meta[property="og:url"]')
-            for og_element in og_url_elements:
-                og_url = await og_element.get_attribute('content')
-                if og_url:
-                    raw_links.append(og_url)
-            
-            await browser.close()
-            
-            # Process and filter links
-            processed_links = set()
-            
-            for link in raw_links:
-                try:
-                    # Skip invalid URLs
-                    if not link or not link.startswith(('http://', 'https://')):
-                        continue
-                    
-                    # Skip non-content URLs
-                    if NON_CONTENT_EXTENSIONS.search(link) or SOCIAL_HOSTS.search(link):
-                        continue
-                    
-                    # Canonicalize the URL
-                    canonical_link = canonicalize_url(link)
-                    processed_links.add(canonical_link)
-                    
-                    # Stop if we've reached the limit
-                    if len(processed_links) >= limit:
-                        break
-                except Exception as e:
-                    logger.debug(f"Error processing link {link}: {str(e)}")
-            
-            return list(processed_links)
-            
-        except Exception as e:
-            await browser.close()
-            raise e
+        logger.info(f"Collecting links from {url} using Playwright")
+        # Don't wait for every subresource, only for the DOM to be parsed
+        await page.goto(url, timeout=10000, wait_until="domcontentloaded")  # 10 second timeout
+        
+        # Collect anchor and og:url links in a single round-trip to the browser
+        raw_links = await page.evaluate(_LINKS_JS)
+    
+    return _filter_links(raw_links, limit)
 
 async def collect_links(url: str, limit: int = 100) -> List[str]:
     """
-    Collect links from a page using either Playwright or Diffbot.
+    Collect links from a page using plain HTTP, Playwright or Diffbot.
+    
+    Methods are tried cheapest first, except that the method which last
+    worked for the same host is tried before the others.
     
     Args:
         url: URL to collect links from
         limit: Maximum number of links to collect
         
     Returns:
-        list: List of links
+        list: List of unique links, already passed through canonicalize_url
         
     Raises:
-        RuntimeError: If failed to collect links with both methods
+        RuntimeError: If failed to collect links with every method
     """
-    links = []
+    collectors = {}
+    if config.ENABLE_HTTP_FAST_PATH:
+        collectors["HTTP"] = collect_links_with_http
+    collectors["Playwright"] = collect_links_with_playwright
+    if config.DIFFBOT_KEYS:
+        collectors["Diffbot"] = collect_links_with_diffbot
     
-    # Try with Playwright first - it's cheaper but sometimes fails
-    try:
-        logger.info(f"Attempting to collect links from {url} using Playwright")
-        links = await collect_links_with_playwright(url, limit=limit)
-        logger.info(f"Successfully collected {len(links)} links with Playwright")
-        return links
-    except Exception as e:
-        logger.warning(f"Failed to collect links with Playwright: {str(e)}")
+    host = urlsplit(url).hostname or ''
+    preferred = _link_strategy.get(host)
     
-    # Fall back to Diffbot if Playwright failed
-    try:
-        logger.info(f"Falling back to Diffbot for {url}")
-        links = await collect_links_with_diffbot(url, limit=limit)
-        logger.info(f"Successfully collected {len(links)} links with Diffbot")
-        return links
-    except Exception as e:
-        logger.error(f"Failed to collect links with Diffbot: {str(e)}")
-        
-    # If we get here, both methods failed
-    if not links:
-        error_msg = f"Failed to collect any links from {url} with both Playwright and Diffbot"
-        logger.error(error_msg)
-        raise RuntimeError(error_msg)
+    # Stable sort: the preferred method moves to the front, the rest keep their order
+    for method in sorted(collectors, key=lambda name: name != preferred):
+        try:
+            logger.info(f"Attempting to collect links from {url} using {method}")
+            links = await collectors[method](url, limit=limit)
+        except Exception as e:
+            logger.warning(f"Failed to collect links with {method}: {str(e)}")
+            if method == preferred:
+                _link_strategy.pop(host, None)
+            continue
         
-    return links 
\ No newline at end of file
+        if links:
+            logger.info(f"Successfully collected {len(links)} links with {method}")
+            _link_strategy[host] = method
+            return links
+        logger.warning(f"No links collected from {url} with {method}")
+    
+    error_msg = f"Failed to collect any links from {url} with {', '.join(collectors)}"
+    logger.error(error_msg)
+    raise RuntimeError(error_msg)
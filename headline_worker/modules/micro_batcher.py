@@ -0,0 +1,85 @@
+"""Micro-batching of concurrent single-item requests."""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-item requests into batched calls.
+    
+    Callers submit one item at a time; a background task groups pending items
+    until the batch is full or max_wait has passed, then passes the whole batch
+    to the handler in one call and hands each caller its own result.
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        batch_size: int,
+        max_wait: float
+    ):
+        self.handler = handler
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+    
+    def _ensure_running(self) -> None:
+        """Start the background batching task if it is not running"""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+    
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+        
+        Args:
+            item: The item to add to the next batch
+            
+        Returns:
+            The handler's result for this item
+            
+        Raises:
+            RuntimeError: If the handler fails for the batch
+        """
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+    
+    async def _run(self) -> None:
+        """Collect queued items into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Batches run concurrently; handlers bound their own concurrency
+            flush = asyncio.create_task(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch: List[tuple]) -> None:
+        """Run the handler on a batch and resolve each caller's future"""
+        items = [item for item, _ in batch]
+        try:
+            results = await self.handler(items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,14 +1,83 @@
 """Multiple sources processor module for processing specific sources by ID."""
 import logging
 import asyncio
-from typing import Dict, Any, List
+from collections import defaultdict
+from typing import Dict, Any, List, Tuple
 
 import config
-from headline_api.db import enqueue_job, update_job_status, update_job_counters, get_source_by_id
+from headline_api.db import enqueue_jobs, update_job_status, update_job_counters, get_sources_by_ids
 from headline_api.models import JobType, JobStatus
 
 logger = logging.getLogger(__name__)
 
+def _build_source_jobs(sources: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Look up the requested sources and build a source job payload for each.
+    
+    Sources are fetched with one query per source table instead of one per source.
+    
+    Args:
+        sources: Dicts with source_id, source_table and optional limit
+    
+    Returns:
+        Tuple of (source job payloads, number of sources that could not be used)
+    """
+    errors = 0
+    
+    # Group the requested IDs by table
+    requested = []
+    ids_by_table = defaultdict(list)
+    for source_info in sources:
+        try:
+            source_id = source_info["source_id"]
+            source_table = source_info["source_table"]
+        except (KeyError, TypeError) as e:
+            logger.error(f"Error processing source {source_info}: missing {str(e)}")
+            errors += 1
+            continue
+        requested.append(source_info)
+        ids_by_table[source_table].append(source_id)
+    
+    # Get source details from database
+    rows_by_table = {}
+    for source_table, source_ids in ids_by_table.items():
+        try:
+            rows_by_table[source_table] = get_sources_by_ids(source_ids, source_table)
+        except Exception as e:
+            logger.error(f"Error fetching sources from {source_table}: {str(e)}")
+            rows_by_table[source_table] = {}
+    
+    payloads = []
+    for source_info in requested:
+        source_id = source_info["source_id"]
+        source_table = source_info["source_table"]
+        limit = source_info.get("limit", 100)
+        
+        logger.info(f"Processing source {source_id} from {source_table} with limit {limit}")
+        
+        source_data = rows_by_table[source_table].get(str(source_id))
+        if not source_data:
+            logger.warning(f"Source {source_id} not found in table {source_table}")
+            errors += 1
+            continue
+        
+        # Try both source_url and url fields
+        source_url = source_data.get("source_url") or source_data.get("url")
+        if not source_url:
+            logger.warning(f"Source {source_id} has no URL (checked both source_url and url fields)")
+            errors += 1
+            continue
+        
+        # Individual source scraping job
+        payloads.append({
+            "url": source_url,
+            "source_id": source_id,
+            "source_table": source_table,
+            "limit": limit
+        })
+    
+    return payloads, errors
+
 async def process_multiple_sources(job_id: int, payload: Dict[str, Any]) -> None:
     """
     Process multiple specific sources by their IDs.
@@ -25,65 +94,32 @@ async def process_multiple_sources(job_id: int, payload: Dict[str, Any]) -> None
     
     logger.info(f"Processing {len(sources)} specific sources")
     
+    # Database calls are blocking, so run them in the executor
+    loop = asyncio.get_running_loop()
+    
     # Update job counters
-    update_job_counters(job_id, {"links_found": len(sources)})
+    await loop.run_in_executor(None, update_job_counters, job_id, {"links_found": len(sources)})
     
     if dry_run:
         logger.info("Dry run, not processing sources")
-        update_job_status(job_id, JobStatus.DONE)
+        await loop.run_in_executor(None, update_job_status, job_id, JobStatus.DONE)
         return
     
-    # Process each source
-    sources_processed = 0
-    errors = 0
+    # Look up all sources, then create their jobs with a single insert
+    payloads, errors = await loop.run_in_executor(None, _build_source_jobs, sources)
     
-    for source_info in sources:
-        try:
-            source_id = source_info["source_id"]
-            source_table = source_info["source_table"]
-            limit = source_info.get("limit", 100)
-            
-            logger.info(f"Processing source {source_id} from {source_table} with limit {limit}")
-            
-            # Get source details from database
-            response = get_source_by_id(source_id, source_table)
-            
-            if not response:
-                logger.warning(f"Source {source_id} not found in table {source_table}")
-                errors += 1
-                continue
-                
-            source_data = response
-            
-            # Try both source_url and url fields
-            source_url = source_data.get("source_url") or source_data.get("url")
-            if not source_url:
-                logger.warning(f"Source {source_id} has no URL (checked both source_url and url fields)")
-                errors += 1
-                continue
-            
-            # Create individual source scraping job
-            source_job_payload = {
-                "url": source_url,
-                "source_id": source_id,
-                "source_table": source_table,
-                "limit": limit
-            }
-            
-            source_job_id = enqueue_job(
-                job_type=JobType.SOURCE,
-                payload=source_job_payload
-            )
-            
-            logger.info(f"Created source job {source_job_id} for source {source_id}")
-            sources_processed += 1
-            
-        except Exception as e:
-            logger.error(f"Error processing source {source_info}: {str(e)}")
-            errors += 1
+    sources_processed = 0
+    try:
+        source_job_ids = await loop.run_in_executor(None, enqueue_jobs, JobType.SOURCE, payloads)
+        for source_payload, source_job_id in zip(payloads, source_job_ids):
+            logger.info(f"Created source job {source_job_id} for source {source_payload['source_id']}")
+        sources_processed = len(source_job_ids)
+    except Exception as e:
+        logger.error(f"Error creating {len(payloads)} source jobs: {str(e)}")
+        errors += len(payloads)
     
     # Update final job counters
-    update_job_counters(job_id, {
+    await loop.run_in_executor(None, update_job_counters, job_id, {
         "articles_saved": sources_processed,  # Using this field to track sources processed
         "errors": errors
     })
@@ -0,0 +1,59 @@
+"""Shared OpenAI client for the headline worker."""
+import logging
+from typing import TYPE_CHECKING, Optional
+
+import config
+
+if TYPE_CHECKING:
+    import openai
+
+logger = logging.getLogger(__name__)
+
+# Fail a stuck request well before the SDK's 10 minute default, while an article holds a concurrency slot
+OPENAI_TIMEOUT = 60  # seconds
+OPENAI_MAX_RETRIES = 2
+OPENAI_CONNECT_TIMEOUT = 5  # seconds
+OPENAI_KEEPALIVE_EXPIRY = 60  # seconds
+
+# Global AsyncOpenAI client instance
+_client: Optional["openai.AsyncOpenAI"] = None
+
+def get_openai_client() -> "openai.AsyncOpenAI":
+    """
+    Get or create the shared AsyncOpenAI client.
+    
+    All worker modules share one client so OpenAI calls reuse a single
+    connection pool instead of opening new connections per request. The
+    openai package is imported on first use, since it takes ~0.5s to load.
+    
+    Returns:
+        The shared AsyncOpenAI client
+    """
+    global _client
+    if _client is None:
+        import httpx
+        import openai
+        
+        logger.info("Creating shared OpenAI client...")
+        _client = openai.AsyncOpenAI(
+            api_key=config.OPENAI_API_KEY,
+            timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+            max_retries=OPENAI_MAX_RETRIES,
+            # HTTP/2 multiplexes concurrent calls over one TLS connection
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY
+                )
+            )
+        )
+    return _client
+
+async def close_openai_client() -> None:
+    """Close the shared AsyncOpenAI client and its connection pool"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -2,27 +2,181 @@
 import logging
 import asyncio
 from typing import Dict, Any, List, Optional
-import traceback
 from datetime import datetime
 
+from cachetools import TTLCache
+
+import config
 from headline_api.models import JobType, JobStatus, ProcessedUrlStatus
 from headline_api.db import (
-    check_processed_url, 
+    check_processed_urls,
     save_processed_url,
     update_job_counters,
     get_source_by_id,
     update_source_scraped_at,
-    enqueue_job
+    enqueue_jobs
 )
 from headline_worker.modules.article_processor import process_article_job
-from headline_worker.modules.content_extractor import extract_content, is_meaningful_content
+from headline_worker.modules.content_extractor import FilteredUrlError, extract_content
 from headline_worker.modules.content_classifier import classify_content
-from headline_worker.modules.url_utils import canonicalize_url
 from headline_worker.modules.link_collector import collect_links
-from headline_worker.metrics import ARTICLES_PROCESSED, JOBS_PROCESSED
+from headline_worker.modules.micro_batcher import MicroBatcher
+from headline_worker.metrics import ARTICLES_PROCESSED, JOBS_PROCESSED, EXTRACT_LATENCY
 
 logger = logging.getLogger(__name__)
 
+# Article jobs created within this window are inserted together
+ARTICLE_JOB_BATCH_SIZE = 50
+ARTICLE_JOB_MAX_WAIT = 0.05  # seconds
+
+async def _enqueue_article_jobs(payloads: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert a batch of article jobs without blocking the event loop.
+    
+    Args:
+        payloads: Article job payloads
+        
+    Returns:
+        The created job IDs, in the same order as payloads
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, enqueue_jobs, JobType.ARTICLE, payloads)
+
+# Global batcher: article jobs from concurrent extractions share one INSERT
+article_job_batcher = MicroBatcher(_enqueue_article_jobs, ARTICLE_JOB_BATCH_SIZE, ARTICLE_JOB_MAX_WAIT)
+
+# Canonical URLs known to be processed. Sources re-link the same articles, and a
+# processed URL never becomes unprocessed, so only positive results are cached.
+PROCESSED_URL_CACHE_TTL = 600  # seconds
+_processed_url_cache: TTLCache = TTLCache(maxsize=100_000, ttl=PROCESSED_URL_CACHE_TTL)
+
+async def _lookup_processed_urls(urls: List[str]) -> Dict[str, ProcessedUrlStatus]:
+    """
+    Find which URLs have already been processed, asking the database only about cache misses.
+    
+    Args:
+        urls: Canonical URLs to check
+        
+    Returns:
+        Mapping of each already-processed URL to its status
+    """
+    processed = {}
+    misses = []
+    for url in urls:
+        status = _processed_url_cache.get(url)
+        if status is None:
+            misses.append(url)
+        else:
+            processed[url] = status
+    
+    if misses:
+        loop = asyncio.get_running_loop()
+        found = await loop.run_in_executor(None, check_processed_urls, misses)
+        _processed_url_cache.update(found)
+        processed.update(found)
+    
+    return processed
+
+async def _process_article_url(
+    article_url: str,
+    source_id: Any,
+    processed_urls: Dict[str, ProcessedUrlStatus]
+) -> Optional[str]:
+    """
+    Run a single collected link through extraction, classification and article processing.
+    
+    Args:
+        article_url: The article URL collected from the source, already canonical
+        source_id: ID of the source the link was collected from
+        processed_urls: Already-processed canonical URLs among the source's links
+        
+    Returns:
+        "processed", "skipped" or "error" for the counters, or None if the link should not be counted
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        # collect_links returns canonical URLs, so no need to canonicalize again
+        canonical_url = article_url
+        
+        # Check if URL has already been processed
+        if canonical_url in processed_urls:
+            logger.info("URL %s already processed, skipping", canonical_url)
+            ARTICLES_PROCESSED.labels(status="already_processed").inc()
+            return "skipped"
+        
+        # Extract content from article URL; obvious non-news URLs are rejected before any fetch
+        try:
+            with EXTRACT_LATENCY.time():
+                article = await extract_content(article_url)
+            if not article:
+                logger.warning("No content extracted from article %s", article_url)
+                ARTICLES_PROCESSED.labels(status="no_content").inc()
+                return None
+        except FilteredUrlError:
+            logger.info("URL matches obvious non-news pattern, skipping: %s", article_url)
+            ARTICLES_PROCESSED.labels(status="obvious_non_news").inc()
+            # Save as processed but don't create article job
+            await loop.run_in_executor(None, save_processed_url, canonical_url, ProcessedUrlStatus.TRASH)
+            _processed_url_cache[canonical_url] = ProcessedUrlStatus.TRASH
+            return "skipped"
+        except Exception as extraction_error:
+            logger.warning("Content extraction failed for %s: %s", article_url, extraction_error)
+            ARTICLES_PROCESSED.labels(status="extraction_failed").inc()
+            return "error"
+        
+        # AI classification - let AI decide what's news vs non-news
+        try:
+            classification = await classify_content(
+                article.get("title", ""), 
+                article.get("text", ""), 
+                article_url
+            )
+            
+            if classification.label == "trash":
+                logger.info("AI classified article as trash: %s", article_url)
+                ARTICLES_PROCESSED.labels(status="ai_classified_trash").inc()
+                await loop.run_in_executor(None, save_processed_url, canonical_url, ProcessedUrlStatus.TRASH)
+                _processed_url_cache[canonical_url] = ProcessedUrlStatus.TRASH
+                return "skipped"
+            
+            logger.info("AI classified article as %s, proceeding: %s", classification.label, article_url)
+        
+        except Exception as e:
+            logger.warning("AI classification failed for %s: %s, proceeding anyway", article_url, e)
+            # If classification fails, proceed with processing but log it
+            classification = None
+        
+        # Create article job only for meaningful, news content
+        article_payload = {
+            "url": article_url,
+            "source_id": source_id,
+            "title": article.get("title", ""),
+            "text": article.get("text", ""),
+            "html": article.get("html", ""),
+            "markdown": article.get("markdown", ""),
+            "metadata": article.get("metadata", {}),
+            "date": article.get("date"),
+            "date_extraction_method": article.get("date_extraction_method"),
+            "scraper_type": article.get("scraper_type"),
+            "clean_html": article.get("clean_html"),
+            "classification": classification.model_dump() if classification else None  # Pass classification to avoid re-classifying
+        }
+        
+        # Create the job, batched with jobs from other articles in flight
+        article_job_id = await article_job_batcher.submit(article_payload)
+        logger.info("Created article job %s for %s", article_job_id, article_url)
+        
+        # Process article immediately
+        await process_article_job(article_job_id, article_payload, already_checked=True)
+        _processed_url_cache[canonical_url] = ProcessedUrlStatus.PROCESSED
+        ARTICLES_PROCESSED.labels(status="success").inc()
+        return "processed"
+    
+    except Exception as e:
+        logger.exception("Error processing article %s: %s", article_url, e)
+        ARTICLES_PROCESSED.labels(status="error").inc()
+        return "error"
+
 async def process_source(job_id: str, payload: Dict[str, Any]) -> None:
     """
     Process a source job by extracting articles and creating article jobs.
@@ -37,11 +191,14 @@ async def process_source(job_id: str, payload: Dict[str, Any]) -> None:
     if not source_id:
         raise ValueError("Missing source_id in payload")
         
-    logger.info(f"Processing source {source_id} from table {source_table}")
+    logger.info("Processing source %s from table %s", source_id, source_table)
+    
+    # Database calls are blocking, so run them in the executor
+    loop = asyncio.get_running_loop()
     
     try:
         # Get source details from database using the specified table
-        source = get_source_by_id(source_id, source_table)
+        source = await loop.run_in_executor(None, get_source_by_id, source_id, source_table)
         if not source:
             raise ValueError(f"Source {source_id} not found in table {source_table}")
             
@@ -55,141 +212,90 @@ async def process_source(job_id: str, payload: Dict[str, Any]) -> None:
         source_url = payload.get("url", source_url)
         limit = payload.get("limit", 15)  # Get limit from payload, default to 15
             
-        logger.info(f"Processing source URL: {source_url}")
+        logger.info("Processing source URL: %s", source_url)
             
         # Collect article links from source
         try:
             article_urls = await collect_links(source_url, limit=limit * 2)  # Collect extra links to allow for skipped links
             if not article_urls:
-                logger.warning(f"No article links found in source {source_id}")
+                logger.warning("No article links found in source %s", source_id)
                 JOBS_PROCESSED.labels(job_type="source", status="no_articles").inc()
                 return
                 
-            logger.info(f"Found {len(article_urls)} article links in source {source_id}")
+            logger.info("Found %s article links in source %s", len(article_urls), source_id)
             
-            # Process each article URL, limiting to specified link count
-            processed_count = 0
-            skipped_count = 0
-            error_count = 0
+            # Look up every link's processed status in at most one query
+            processed_urls = await _lookup_processed_urls(article_urls)
             
-            for article_url in article_urls:
-                # Check if we've reached our limit of successfully processed + skipped links
-                if processed_count + skipped_count >= limit:
-                    logger.info(f"Reached limit of {limit} links for source {source_id}")
-                    break
-                    
-                try:
-                    # Canonicalize URL for checking if already processed
-                    canonical_url = canonicalize_url(article_url)
-                    
-                    # Check if URL has already been processed
-                    processed_status = check_processed_url(canonical_url)
-                    if processed_status:
-                        logger.info(f"URL {canonical_url} already processed, skipping")
-                        skipped_count += 1
-                        ARTICLES_PROCESSED.labels(status="already_processed").inc()
-                        continue
-                    
-                    # Early URL validation - filter out obvious non-news URLs before extraction
-                    if not is_meaningful_content({}, article_url):  # Pass empty dict since we only check URL
-                        logger.info(f"URL matches obvious non-news pattern, skipping: {article_url}")
-                        ARTICLES_PROCESSED.labels(status="obvious_non_news").inc()
-                        # Save as processed but don't create article job
-                        save_processed_url(canonical_url, ProcessedUrlStatus.TRASH)
-                        skipped_count += 1
-                        continue
-                    
-                    # Extract content from article URL
-                    try:
-                        article = await extract_content(article_url)
-                        if not article:
-                            logger.warning(f"No content extracted from article {article_url}")
-                            ARTICLES_PROCESSED.labels(status="no_content").inc()
-                            continue
-                    except Exception as extraction_error:
-                        logger.warning(f"Content extraction failed for {article_url}: {str(extraction_error)}")
-                        ARTICLES_PROCESSED.labels(status="extraction_failed").inc()
-                        error_count += 1
-                        continue
-                    
-                    # AI classification - let AI decide what's news vs non-news
-                    try:
-                        classification = await classify_content(
-                            article.get("title", ""), 
-                            article.get("text", ""), 
-                            article_url
+            # Process article URLs with a fixed set of workers pulling from one shared iterator.
+            # Each article reserves a slot of the limit before it starts, so articles already
+            # in flight count against it; slots of articles that don't end up processed or
+            # skipped are released for the next link.
+            counts = {"processed": 0, "skipped": 0, "error": 0}
+            in_flight = 0
+            slot_released = asyncio.Condition()
+            pending_urls = iter(article_urls)
+            
+            def budget_available() -> bool:
+                return counts["processed"] + counts["skipped"] + in_flight < limit
+            
+            async def worker() -> None:
+                nonlocal in_flight
+                for article_url in pending_urls:
+                    async with slot_released:
+                        # Wait while the remaining slots are held by articles in flight
+                        await slot_released.wait_for(
+                            lambda: budget_available() or counts["processed"] + counts["skipped"] >= limit
                         )
-                        
-                        if classification.label == "trash":
-                            logger.info(f"AI classified article as trash: {article_url}")
-                            ARTICLES_PROCESSED.labels(status="ai_classified_trash").inc()
-                            save_processed_url(canonical_url, ProcessedUrlStatus.TRASH)
-                            skipped_count += 1
-                            continue
-                            
-                        logger.info(f"AI classified article as {classification.label}, proceeding: {article_url}")
-                        
+                        # Check if we've reached our limit of successfully processed + skipped links
+                        if not budget_available():
+                            return
+                        in_flight += 1
+                    try:
+                        outcome = await _process_article_url(article_url, source_id, processed_urls)
                     except Exception as e:
-                        logger.warning(f"AI classification failed for {article_url}: {str(e)}, proceeding anyway")
-                        # If classification fails, proceed with processing but log it
-                        classification = None
-                    
-                    # Create article job only for meaningful, news content
-                    article_payload = {
-                        "url": article_url,
-                        "source_id": source_id,
-                        "title": article.get("title", ""),
-                        "text": article.get("text", ""),
-                        "html": article.get("html", ""),
-                        "markdown": article.get("markdown", ""),
-                        "metadata": article.get("metadata", {}),
-                        "date": article.get("date"),
-                        "date_extraction_method": article.get("date_extraction_method"),
-                        "scraper_type": article.get("scraper_type"),
-                        "clean_html": article.get("clean_html"),
-                        "classification": classification.model_dump() if classification else None  # Pass classification to avoid re-classifying
-                    }
-                    
-                    # Create job using the new PostgreSQL function
-                    article_job_id = enqueue_job(JobType.ARTICLE, article_payload)
-                    logger.info(f"Created article job {article_job_id} for {article_url}")
-                    
-                    # Process article immediately
-                    await process_article_job(article_job_id, article_payload)
-                    processed_count += 1
-                    ARTICLES_PROCESSED.labels(status="success").inc()
-                    
-                except Exception as e:
-                    logger.error(f"Error processing article {article_url}: {str(e)}\n{traceback.format_exc()}")
-                    error_count += 1
-                    ARTICLES_PROCESSED.labels(status="error").inc()
-                    continue
+                        # _process_article_url handles its own errors; anything here escaped it
+                        logger.error("Unhandled error processing article %s: %s", article_url, e)
+                        outcome = "error"
+                    async with slot_released:
+                        in_flight -= 1
+                        if outcome in counts:
+                            counts[outcome] += 1
+                        slot_released.notify_all()
+            
+            await asyncio.gather(*(worker() for _ in range(min(config.MAX_CONCURRENT_ARTICLES, len(article_urls)))))
+            
+            processed_count = counts["processed"]
+            skipped_count = counts["skipped"]
+            error_count = counts["error"]
+            if processed_count + skipped_count >= limit:
+                logger.info("Reached limit of %s links for source %s", limit, source_id)
             
             # Log summary
-            logger.info(f"Source {source_id} processing summary: {processed_count} processed, {skipped_count} skipped, {error_count} errors")
+            logger.info("Source %s processing summary: %s processed, %s skipped, %s errors", source_id, processed_count, skipped_count, error_count)
             
             # Update job counters if this is a job
             if job_id is not None:
                 try:
                     job_id_int = int(job_id) if isinstance(job_id, str) else job_id
-                    update_job_counters(job_id_int, {
+                    await loop.run_in_executor(None, update_job_counters, job_id_int, {
                         "articles_saved": processed_count,
                         "links_skipped": skipped_count,
                         "errors": error_count
                     })
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not update job counters for job_id {job_id}: {str(e)}")
+                    logger.warning("Could not update job counters for job_id %s: %s", job_id, e)
                     # Don't fail the entire process for counter update issues
                     
         except Exception as e:
-            logger.error(f"Failed to collect links from source {source_url}: {str(e)}\n{traceback.format_exc()}")
+            logger.exception("Failed to collect links from source %s: %s", source_url, e)
             JOBS_PROCESSED.labels(job_type="source", status="link_collection_failed").inc()
             raise
                 
         # Update last_scraped_at timestamp if it's a bighippo_sources table
         if source_table == "bighippo_sources":
-            update_source_scraped_at(source_id, source_table)
-            logger.info(f"Updated last_scraped_at for source {source_id}")
+            await loop.run_in_executor(None, update_source_scraped_at, source_id, source_table)
+            logger.info("Updated last_scraped_at for source %s", source_id)
                 
     except Exception as e:
         JOBS_PROCESSED.labels(job_type="source", status="error").inc()
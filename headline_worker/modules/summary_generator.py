@@ -1,45 +1,45 @@
 """Content summary generator module."""
 import logging
-import json
 import re
 from typing import Dict, Any, Optional, Tuple
-import openai
-import traceback
 
-import config
+import orjson
+
 from headline_api.models import ArticleClassification
+from headline_worker.modules.content_classifier import extract_json_from_text
+from headline_worker.modules.openai_client import get_openai_client
 from headline_worker.prompts import GLOBAL_INDUSTRY_PROMPT, CITY_PROMPT
 
 logger = logging.getLogger(__name__)
 
-def extract_json_from_text(text: str) -> str:
+# Placeholders the prompts were written with (JavaScript template syntax)
+CONTENT_PLACEHOLDER = "${markdown.substring(0, 4000)}"
+METADATA_PLACEHOLDER = "${metadataString}"
+_PLACEHOLDER_RE = re.compile(f"({re.escape(CONTENT_PLACEHOLDER)}|{re.escape(METADATA_PLACEHOLDER)})")
+
+# Each prompt split once at import into literal chunks and placeholders, keyed by classification label
+_CITY_PROMPT_PARTS = tuple(_PLACEHOLDER_RE.split(CITY_PROMPT))
+_GLOBAL_INDUSTRY_PROMPT_PARTS = tuple(_PLACEHOLDER_RE.split(GLOBAL_INDUSTRY_PROMPT))
+PROMPT_PARTS = {
+    "city": _CITY_PROMPT_PARTS,
+    "global": _GLOBAL_INDUSTRY_PROMPT_PARTS,
+    "industry": _GLOBAL_INDUSTRY_PROMPT_PARTS
+}
+
+def render_prompt(prompt_parts: Tuple[str, ...], content: str, metadata_str: str) -> str:
     """
-    Extract valid JSON from text, handling potential formatting issues.
+    Fill a pre-split prompt's placeholders in a single join.
     
     Args:
-        text: Text that may contain JSON
+        prompt_parts: Prompt split around its placeholders, from PROMPT_PARTS
+        content: Article content to substitute for the content placeholder
+        metadata_str: Formatted metadata to substitute for the metadata placeholder
         
     Returns:
-        Cleaned JSON string
+        The complete prompt
     """
-    # Remove code block markers
-    text = text.strip()
-    if text.startswith('```json'):
-        text = text[7:]
-    elif text.startswith('```'):
-        text = text[3:]
-    if text.endswith('```'):
-        text = text[:-3]
-    text = text.strip()
-    
-    # Try to find JSON-like structure using regex
-    json_pattern = r'(?:\s*\{\s*.*?\s*\}\s*)'
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    if matches:
-        return matches[0]
-    
-    # If no pattern match, return the original text 
-    return text
+    values = {CONTENT_PLACEHOLDER: content, METADATA_PLACEHOLDER: metadata_str}
+    return "".join([values.get(part, part) for part in prompt_parts])
 
 async def process_article(
     classification: ArticleClassification, 
@@ -47,7 +47,7 @@ async def process_article(
     text: str,
     markdown: str,
     metadata: Dict[str, Any],
-    clean_html: str = None
+    clean_html: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Process an article based on its classification using the appropriate prompt.
@@ -68,15 +68,12 @@ async def process_article(
     """
     try:
         # Select the appropriate prompt based on classification
-        if classification.label == "city":
-            prompt_template = CITY_PROMPT
-        elif classification.label in ["global", "industry"]:
-            prompt_template = GLOBAL_INDUSTRY_PROMPT
-        else:
+        prompt_parts = PROMPT_PARTS.get(classification.label)
+        if prompt_parts is None:
             raise ValueError(f"Invalid classification label: {classification.label}")
             
         # Format metadata as string
-        metadata_str = "\n".join(f"{k}: {v}" for k, v in metadata.items())
+        metadata_str = "\n".join(f"{k}: {v}" for k, v in metadata.items()) if metadata else ""
         
         # Use clean HTML if available, otherwise use markdown
         # Clean HTML provides better context for date extraction and analysis
@@ -86,48 +83,53 @@ async def process_article(
         max_content_length = 6000 if clean_html else 4000
         content_for_analysis = content_for_analysis[:max_content_length]
             
-        # Format the prompt with article content
-        formatted_prompt = prompt_template.replace(
-            "${markdown.substring(0, 4000)}", 
-            content_for_analysis  # Use clean HTML or markdown content
-        ).replace(
-            "${metadataString}",
-            metadata_str
-        )
+        # Format the prompt with article content (clean HTML or markdown) and metadata
+        formatted_prompt = render_prompt(prompt_parts, content_for_analysis, metadata_str)
         
         # Call OpenAI API with JSON response format
-        client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+        client = get_openai_client()
         
         # Log the prompt we're sending (truncated for readability)
-        logger.debug(f"Sending prompt to OpenAI (first 500 chars):\n{formatted_prompt[:500]}...")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Sending prompt to OpenAI (first 500 chars):\n{formatted_prompt[:500]}...")
         
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You analyze news articles and provide structured summaries and metadata. Always respond with valid JSON. Pay special attention to extracting accurate publication dates from both metadata and content."},
                 {"role": "user", "content": formatted_prompt}
             ],
             temperature=0.3,
-            response_format={"type": "json_object"}  # Request JSON output
+            response_format={"type": "json_object"},  # Request JSON output
+            stream=True
         )
         
-        # Get the response text
-        result_text = response.choices[0].message.content.strip()
-        logger.debug(f"Raw GPT response (first 500 chars):\n{result_text[:500]}...")
+        # Collect the streamed response text
+        chunks = []
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                chunks.append(chunk.choices[0].delta.content)
+        result_text = "".join(chunks).strip()
+        if debug_enabled:
+            logger.debug(f"Raw GPT response (first 500 chars):\n{result_text[:500]}...")
         
         # Parse JSON response
         try:
-            result = json.loads(result_text)
-            logger.debug(f"Parsed JSON result (keys): {list(result.keys())}")
-        except json.JSONDecodeError as e:
+            result = orjson.loads(result_text)
+            if debug_enabled:
+                logger.debug(f"Parsed JSON result (keys): {list(result.keys())}")
+        except orjson.JSONDecodeError as e:
             # Try to extract JSON from text if direct parsing fails
             logger.warning(f"Initial JSON parse failed: {str(e)}")
             cleaned_text = extract_json_from_text(result_text)
-            logger.debug(f"Cleaned text for parsing (first 200 chars):\n{cleaned_text[:200]}...")
+            if debug_enabled:
+                logger.debug(f"Cleaned text for parsing (first 200 chars):\n{cleaned_text[:200]}...")
             try:
-                result = json.loads(cleaned_text)
-                logger.debug(f"Parsed JSON from cleaned text (keys): {list(result.keys())}")
-            except json.JSONDecodeError as e2:
+                result = orjson.loads(cleaned_text)
+                if debug_enabled:
+                    logger.debug(f"Parsed JSON from cleaned text (keys): {list(result.keys())}")
+            except orjson.JSONDecodeError as e2:
                 logger.error(f"Failed to parse JSON response: {str(e2)}")
                 raise ValueError(f"Failed to parse response as JSON: {str(e2)}")
         
@@ -142,6 +144,5 @@ async def process_article(
         return result
             
     except Exception as e:
-        logger.error(f"Article processing failed: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Article processing failed: %s", e)
         raise ValueError(f"Article processing failed: {str(e)}") 
\ No newline at end of file
@@ -1,13 +1,67 @@
 """URL utilities for the headline worker."""
 import re
-from urllib.parse import urlparse, parse_qs, urlunparse
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
 
-# Enhanced file extension filtering (Point 1)
-NON_CONTENT_EXTENSIONS = re.compile(r'\.(jpg|jpeg|png|gif|bmp|webp|svg|ico|tiff|mp4|avi|mov|wmv|flv|mkv|m4v|webm|mp3|wav|ogg|m4a|aac|css|js|json|xml|rss|pdf|zip|rar|doc|docx|xls|xlsx|ppt|pptx)$', re.IGNORECASE)
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', '_ga', 'ref', 'source'
+})
+
+def _trie_alternation(words) -> str:
+    """
+    Build a regex alternation of literal strings, factored into a prefix trie.
+    
+    Python's re tries alternatives one by one, so e.g. ['doc', 'docx', 'dot']
+    becomes 'do(?:cx?|t)' and shared prefixes are only matched once.
+    
+    Args:
+        words: Literal strings to match
+        
+    Returns:
+        Regex pattern (without a capturing group) matching any of the words
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end of word
+    
+    def build(node) -> str:
+        optional = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        if len(branches) == 1 and len(branches[0]) == 1:
+            return branches[0] + '?'
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if optional else pattern
+    
+    return build(trie)
+
+# Enhanced file extension filtering (Point 1), also when a query string or fragment follows
+NON_CONTENT_EXTENSION_NAMES = (
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp', 'svg', 'ico', 'tiff',
+    'mp4', 'avi', 'mov', 'wmv', 'flv', 'mkv', 'm4v', 'webm',
+    'mp3', 'wav', 'ogg', 'm4a', 'aac',
+    'css', 'js', 'json', 'xml', 'rss',
+    'pdf', 'zip', 'rar', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx'
+)
+NON_CONTENT_EXTENSIONS = re.compile(rf'\.{_trie_alternation(NON_CONTENT_EXTENSION_NAMES)}(?:$|[?#])', re.IGNORECASE)
 
 # Enhanced social hosts patterns (Point 6)
 SOCIAL_HOSTS = re.compile(r'(facebook\.com|twitter\.com|instagram\.com|linkedin\.com|youtube\.com|tiktok\.com|pinterest\.com)', re.IGNORECASE)
 
+# Points 1 and 6 folded into one pattern so a link is scanned once
+NON_CONTENT_OR_SOCIAL = re.compile(
+    f'(?:{NON_CONTENT_EXTENSIONS.pattern})|(?:{SOCIAL_HOSTS.pattern})', re.IGNORECASE
+)
+
 # Static/Media subdomain patterns (Point 2)
 STATIC_MEDIA_PATTERNS = [
     'images.', 'img.', 'cdn.', 'static.', 'image.',
@@ -58,12 +112,12 @@ GOV_SKIP_PATHS = [
 NON_ARTICLE_PATHS = [
     # Common non-article paths
     '/search', '/tag', '/category', '/author', '/about', '/contact', '/privacy', '/terms', '/login', '/register', '/welcome',
-    '/contact', '/privacy', '/terms', '/login', '/register', '/public-safety', '/public-safety.aspx', '/public-safety.html', '/public-safety.php', '/public-safety.asp',
+    '/public-safety', '/public-safety.aspx', '/public-safety.html', '/public-safety.php', '/public-safety.asp',
     '/subscribe', '/wp-admin', '/wp-includes', '/cdn-cgi', '#main-content', '/emergency-preparedness',
     '/static', '/media', '/images', '/css', '/js', '/fonts', '/doing-business',
     '/assets', '/weather', '/traffic', '/contests', '/apps',
     '/advertise', '/careers', '/jobs', '/staff', '/newsletters',
-    '/subscribe', '/subscription', '/help', '/faq', '/support','/welcome',
+    '/subscription', '/help', '/faq', '/support',
     '/calendar', '/events', '/directory', '/classified', '/person', '/winning-question', 
     '/marketplace', '/shop', '/donate', '/giving', '/sponsors',
     '/discover', '/development-pipeline', '/development', '/team',
@@ -74,6 +128,44 @@ NON_ARTICLE_PATHS = [
     '/station-info', '/corporate-info', '/legal', '/accessibility-statement'
 ]
 
+# Each pattern list compiled once, so a check is one regex scan instead of a Python-level any() loop
+STATIC_MEDIA_RE = re.compile(_trie_alternation(STATIC_MEDIA_PATTERNS))
+SKIP_QUERY_PARAMS_RE = re.compile(_trie_alternation(SKIP_QUERY_PARAMS))
+SOCIAL_SHARING_RE = re.compile(_trie_alternation(SOCIAL_SHARING_PATTERNS))
+
+# Social hosts (Point 6) and sharing patterns in one scan of the lowercased URL
+SOCIAL_HOST_OR_SHARING_RE = re.compile(f'{SOCIAL_HOSTS.pattern}|{SOCIAL_SHARING_RE.pattern}')
+
+# Exact-match path sets; every non-article path is a single segment, so a path
+# matches when its first segment is in the set
+SECTION_PATH_SET = frozenset(SECTION_PATHS)
+NON_ARTICLE_PATH_SET = frozenset(NON_ARTICLE_PATHS)
+
+# GOV_SKIP_PATHS split once: entries ending in '$' match exactly, the rest as path prefixes
+GOV_SKIP_EXACT_PATHS = frozenset(skip_path[:-1] for skip_path in GOV_SKIP_PATHS if skip_path.endswith('$'))
+GOV_SKIP_PREFIX_RE = re.compile(_trie_alternation(
+    skip_path for skip_path in GOV_SKIP_PATHS if not skip_path.endswith('$')
+))
+
+# scheme://netloc/path?query#fragment in a single match; cheaper than urlsplit for filtering
+URL_PARTS_RE = re.compile(r'([^:/?#]+)://([^/?#]*)([^?#]*)(?:\?([^#]*))?(?:#(.*))?', re.DOTALL)
+
+def _hostname(netloc: str) -> str:
+    """Host of a netloc, without credentials or port (as urlsplit's hostname, minus the lowercasing)"""
+    host = netloc.rpartition('@')[2]
+    if host.startswith('['):
+        host = host[1:host.find(']')]
+    else:
+        host = host.partition(':')[0]
+    return host
+
+# A URL canonicalize_url would return unchanged: lowercase http(s) host without www.,
+# no trailing slash (so no bare '/' path), and no ;params, query, fragment, whitespace or control characters
+CANONICAL_URL_RE = re.compile(
+    r'https?://(?!www\.)[a-z0-9.\-]+(?::[0-9]+)?(?:/[^;?#\x00-\x20\x7f]*[^/;?#\x00-\x20\x7f])?'
+)
+
+@lru_cache(maxsize=65536)
 def canonicalize_url(url: str) -> str:
     """
     Canonicalize a URL by normalizing various components.
@@ -84,43 +176,135 @@ def canonicalize_url(url: str) -> str:
     Returns:
         The canonicalized URL
     """
+    # Already canonical, e.g. a link that came out of a collector
+    if CANONICAL_URL_RE.fullmatch(url):
+        return url
+    
     # Parse URL
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     
-    # Convert scheme and netloc to lowercase
-    scheme = parsed.scheme.lower()
-    netloc = parsed.netloc.lower()
+    # Convert netloc to lowercase and remove www. (they are usually lowercase already)
+    scheme = parsed.scheme if parsed.scheme.islower() else parsed.scheme.lower()
+    netloc = (parsed.netloc if parsed.netloc.islower() else parsed.netloc.lower()).removeprefix('www.')
     
-    # Remove www.
-    if netloc.startswith('www.'):
-        netloc = netloc[4:]
+    # Drop ;params (e.g. ;jsessionid=...) from the last path segment, as urlparse does
+    path = parsed.path
+    if ';' in path:
+        params_start = path.find(';', max(path.rfind('/'), 0))
+        if params_start >= 0:
+            path = path[:params_start]
     
-    # Parse query parameters
-    query_params = parse_qs(parsed.query)
+    # Remove trailing slash from path, including a bare root '/'
+    path = path.rstrip('/')
     
-    # Remove tracking parameters (common ones)
-    tracking_params = {'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 
-                      'fbclid', 'gclid', '_ga', 'ref', 'source'}
-    query_params = {k: v for k, v in query_params.items() if k.lower() not in tracking_params}
+    # Most article URLs have no query, so there is nothing to filter or reassemble
+    if not parsed.query and scheme and netloc:
+        return f"{scheme}://{netloc}{path}"
     
-    # Rebuild query string
+    # Drop tracking and empty parameters in one pass, then sort for consistency.
+    # Keys and values are decoded like parse_qs did, keeping stored dedup keys stable
     query_items = []
-    for key in sorted(query_params.keys()):  # Sort for consistency
-        for value in sorted(query_params[key]):  # Sort values too
-            query_items.append(f"{key}={value}")
-    query = '&'.join(query_items)
+    if parsed.query:
+        for item in parsed.query.split('&'):
+            key, _, value = item.partition('=')
+            if not value:
+                continue
+            key = unquote_plus(key)
+            if key.lower() not in TRACKING_PARAMS:
+                query_items.append((key, unquote_plus(value)))
+        if len(query_items) > 1:
+            query_items.sort()
+    query = '&'.join(map('='.join, query_items))
+    
+    # Rebuild URL without the fragment
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+@lru_cache(maxsize=1024)
+def _base_domain(base_url: str) -> str:
+    """Host of a source URL without www., or '' if it has none (one parse per source)"""
+    base_match = URL_PARTS_RE.match(base_url)
+    return _hostname(base_match.group(2)).lower().removeprefix('www.') if base_match else ''
+
+@lru_cache(maxsize=65536)
+def _article_domain(url: str) -> Optional[str]:
+    """
+    Run the source-independent article checks on a URL.
+    
+    Cached, since the same links turn up on every crawl of a source.
+    
+    Args:
+        url: The URL to check
+        
+    Returns:
+        The URL's host without www. if it looks like an article, None otherwise
+    """
+    # Skip URLs that don't start with http:// or https://, and anchors (Point 7)
+    if not url.startswith(('http://', 'https://')) or '#' in url:
+        return None
+    
+    # Lowercase once; host and path are taken from this copy
+    url_lower = url.lower()
+    
+    # Split host and path by offset; the prefix check guarantees '://' and there is no '#'
+    host_start = url_lower.find('://') + 3
+    path_end = url_lower.find('?', host_start)
+    if path_end == -1:
+        path_end = len(url_lower)
+    path_start = url_lower.find('/', host_start, path_end)
+    if path_start == -1:
+        path_start = path_end
+    path = url_lower[path_start:path_end]
+    
+    # The remaining checks are ordered cheapest first: set lookups, then short regex
+    # scans of one URL part, then the scan of the whole URL and the .gov rules
     
-    # Remove fragment
-    fragment = ''
+    # Point 7: Root/Homepage URL filtering, also when only a query follows
+    if path == '/' or path == '':
+        return None
     
-    # Remove trailing slash from path
-    path = parsed.path.rstrip('/')
-    if not path:
-        path = '/'
+    # Point 5: Section page vs article detection
+    if path in SECTION_PATH_SET:
+        return None
     
-    # Rebuild URL
-    canonical = urlunparse((scheme, netloc, path, '', query, fragment))
-    return canonical
+    # Point 8: Non-article path patterns
+    segment_end = path.find('/', 1)
+    if (path if segment_end == -1 else path[:segment_end]) in NON_ARTICLE_PATH_SET:
+        return None
+    
+    # Point 1: Enhanced file extension filtering, on the path only since queries can be long
+    if NON_CONTENT_EXTENSIONS.search(path):
+        return None
+    
+    # Point 2: Static/Media subdomain detection
+    hostname = _hostname(url_lower[host_start:path_start])
+    if STATIC_MEDIA_RE.search(hostname):
+        return None
+    
+    # Point 3: Query parameter filtering
+    # Query parameter rules are case-sensitive, so take the query from the original URL
+    if SKIP_QUERY_PARAMS_RE.search(url.partition('?')[2]):
+        return None
+    
+    # Point 6: Social media hosts and sharing URLs
+    if SOCIAL_HOST_OR_SHARING_RE.search(url_lower):
+        return None
+    
+    # Point 4: .gov domain special logic
+    if '.gov' in hostname:
+        # Allow news articles from city-news directory with additional path segments
+        if path.startswith('/city-news/'):
+            # Allow if it's an actual article (a non-empty segment after /city-news/)
+            # Reject if it's just "/city-news/" (ends with slash and no content after)
+            if path[11:12] in ('', '/'):
+                return None
+        else:
+            # Check for common navigation page patterns
+            if (path.endswith(('/home', '/index')) or
+                path in GOV_SKIP_EXACT_PATHS or
+                GOV_SKIP_PREFIX_RE.match(path)):
+                return None
+    
+    return hostname.removeprefix('www.')
 
 def is_valid_article_url(url: str, base_url: str) -> bool:
     """
@@ -133,101 +317,11 @@ def is_valid_article_url(url: str, base_url: str) -> bool:
     Returns:
         bool: True if the URL is likely an article, False otherwise
     """
-    # Skip URLs that don't start with http:// or https://
-    if not url.startswith(('http://', 'https://')):
+    url_domain = _article_domain(url)
+    if url_domain is None:
         return False
     
-    try:
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        hostname = parsed_url.netloc.lower()
-        full_url = url.lower()
-        
-        # Point 7: Root/Homepage URL filtering
-        if path == '/' or path == '' or '#' in url:
-            return False
-        
-        # Point 7: Skip URLs with only query parameters and no path
-        if path == '/' and parsed_url.query:
-            return False
-        
-        # Point 1: Enhanced file extension filtering
-        if NON_CONTENT_EXTENSIONS.search(url):
-            return False
-        
-        # Point 2: Static/Media subdomain detection
-        if any(pattern in hostname for pattern in STATIC_MEDIA_PATTERNS):
-            return False
-        
-        # Point 3: Query parameter filtering
-        if any(param in parsed_url.query for param in SKIP_QUERY_PARAMS):
-            return False
-        
-        # Point 6: Social sharing URL detection
-        if any(pattern in full_url for pattern in SOCIAL_SHARING_PATTERNS):
-            return False
-        
-        # Point 6: Social media hosts
-        if SOCIAL_HOSTS.search(url):
-            return False
-        
-        # Point 5: Section page vs article detection
-        if any(path == section for section in SECTION_PATHS):
-            return False
-        
-        # Point 4: .gov domain special logic
-        if '.gov' in hostname:
-            # Allow news articles from city-news directory with additional path segments
-            if path.startswith('/city-news/'):
-                path_segments = path.split('/')[1:]  # Remove empty first element
-                # Allow if it's an actual article (has more than just /city-news/)
-                # Reject if it's just "/city-news/" (ends with slash and no content after)
-                if len(path_segments) > 1 and path_segments[1] and '?' not in path:
-                    # This is likely an article, continue with other checks
-                    pass
-                else:
-                    return False
-            else:
-                # Check for common navigation page patterns
-                if (path == '/' or 
-                    path.endswith('/home') or 
-                    path.endswith('/index') or
-                    any(skip_path.endswith('$') and path == skip_path[:-1] or 
-                        not skip_path.endswith('$') and path.startswith(skip_path) 
-                        for skip_path in GOV_SKIP_PATHS)):
-                    return False
-        
-        # Point 8: Non-article path patterns
-        for pattern in NON_ARTICLE_PATHS:
-            if path == pattern or path.startswith(pattern + '/'):
-                return False
-        
-        # Domain validation (existing logic)
-        try:
-            base_domain = re.search(r'https?://([^/]+)', base_url).group(1)
-            url_domain = re.search(r'https?://([^/]+)', url).group(1)
-            
-            # Strip www. prefix for comparison
-            base_domain = base_domain.replace('www.', '')
-            url_domain = url_domain.replace('www.', '')
-            
-            # Check if it's the same domain or a subdomain
-            if not (url_domain == base_domain or url_domain.endswith('.' + base_domain)):
-                # Enhanced CDN patterns (Point 2)
-                enhanced_cdn_patterns = STATIC_MEDIA_PATTERNS + ['cdn.', 'media.', 'assets.', 'img.', 'images.']
-                is_cdn = any(cdn in url_domain for cdn in enhanced_cdn_patterns)
-                if not is_cdn:
-                    return False
-        except:
-            # If we can't parse the domain, consider it invalid
-            return False
-        
-        # Special cases: Always allow certain patterns
-        if 'civicalerts.aspx' in path or 'campaign-archive.com' in hostname:
-            return True
-        
-        return True
-        
-    except Exception:
-        # If URL parsing fails, consider it invalid
-        return False 
\ No newline at end of file
+    # Domain validation: only same domain or a subdomain of the source.
+    # Static/CDN hosts were already rejected by the Point 2 check.
+    base_domain = _base_domain(base_url)
+    return bool(base_domain) and (url_domain == base_domain or url_domain.endswith('.' + base_domain))
@@ -4,7 +4,7 @@ Setup script for creating a .env file with required environment variables.
 This script will prompt for API keys and other configuration values.
 """
 
-import os
+import secrets
 
 def main():
     """
@@ -24,29 +24,30 @@ def main():
     pinecone_key = input("Pinecone API Key (optional): ").strip()
     pinecone_env = input("Pinecone Environment (optional): ").strip()
     pinecone_index = input("Pinecone Index (optional, default: headline-articles): ").strip() or "headline-articles"
-    jwt_secret = input("JWT Secret (optional, will generate if empty): ").strip() or "supersecret"
+    jwt_secret = input("JWT Secret (optional, will generate if empty): ").strip() or secrets.token_urlsafe(48)
     log_level = input("Log Level (optional, default: INFO): ").strip() or "INFO"
     
     # Ask about enabling embeddings
     enable_embeddings = input("Enable embeddings? (yes/no, default: no): ").strip().lower()
     enable_embeddings = "true" if enable_embeddings in ["yes", "y", "true"] else "false"
     
+    # Optional keys left empty are omitted
+    env = {
+        "OPENAI_API_KEY": openai_key,
+        "DIFFBOT_KEYS": diffbot_keys,
+        "SUPABASE_URL": supabase_url,
+        "SUPABASE_SERVICE_KEY": supabase_key,
+        "PINECONE_API_KEY": pinecone_key or None,
+        "PINECONE_ENV": pinecone_env or None,
+        "PINECONE_INDEX": pinecone_index,
+        "JWT_SECRET": jwt_secret,
+        "LOG_LEVEL": log_level,
+        "ENABLE_EMBEDDINGS": enable_embeddings
+    }
+    
     # Create .env file
     with open(".env", "w") as f:
-        f.write(f"OPENAI_API_KEY={openai_key}\n")
-        f.write(f"DIFFBOT_KEYS={diffbot_keys}\n")
-        f.write(f"SUPABASE_URL={supabase_url}\n")
-        f.write(f"SUPABASE_SERVICE_KEY={supabase_key}\n")
-        
-        if pinecone_key:
-            f.write(f"PINECONE_API_KEY={pinecone_key}\n")
-        if pinecone_env:
-            f.write(f"PINECONE_ENV={pinecone_env}\n")
-        f.write(f"PINECONE_INDEX={pinecone_index}\n")
-        
-        f.write(f"JWT_SECRET={jwt_secret}\n")
-        f.write(f"LOG_LEVEL={log_level}\n")
-        f.write(f"ENABLE_EMBEDDINGS={enable_embeddings}\n")
+        f.write("\n".join(f"{key}={value}" for key, value in env.items() if value is not None) + "\n")
     
     print("\nEnvironment variables saved to .env file")
     print("\nTo run the application:")
@@ -86,6 +86,12 @@ if [ $? -ne 0 ]; then
     exit 1
 fi
 
+# Reset the Prometheus multiprocess directory if one is configured
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 # Start the worker in background
 echo "Starting worker..."
 $PYTHON_CMD -m headline_worker $RESUME_JOBS &
@@ -2,34 +2,47 @@
 import pytest
 from headline_worker.modules.content_extractor import canonicalize_url
 
-def test_canonicalize_url():
-    """Test URL canonicalization."""
+CANONICALIZE_CASES = [
     # Test basic canonicalization
-    assert canonicalize_url("http://example.com") == "http://example.com"
+    ("http://example.com", "http://example.com"),
     
     # Test scheme lowercasing
-    assert canonicalize_url("HTTP://example.com") == "http://example.com"
+    ("HTTP://example.com", "http://example.com"),
     
     # Test host lowercasing
-    assert canonicalize_url("http://EXAMPLE.com") == "http://example.com"
+    ("http://EXAMPLE.com", "http://example.com"),
     
     # Test www stripping
-    assert canonicalize_url("http://www.example.com") == "http://example.com"
+    ("http://www.example.com", "http://example.com"),
     
     # Test trailing slash removal
-    assert canonicalize_url("http://example.com/") == "http://example.com"
+    ("http://example.com/", "http://example.com"),
     
     # Test path preservation
-    assert canonicalize_url("http://example.com/path/to/page") == "http://example.com/path/to/page"
+    ("http://example.com/path/to/page", "http://example.com/path/to/page"),
     
     # Test tracking params removal
-    assert canonicalize_url("http://example.com?utm_source=test") == "http://example.com"
+    ("http://example.com?utm_source=test", "http://example.com"),
     
     # Test regular params preservation
-    assert canonicalize_url("http://example.com?id=123") == "http://example.com?id=123"
+    ("http://example.com?id=123", "http://example.com?id=123"),
+    
+    # Test query decoding, which keeps the stored dedup keys stable
+    ("http://example.com/story?id=a+b", "http://example.com/story?id=a b"),
+    ("http://example.com/story?name=caf%C3%A9", "http://example.com/story?name=café"),
+    
+    # Test ;params removal from the last path segment
+    ("http://example.com/story;jsessionid=abc", "http://example.com/story"),
+    ("http://example.com/a;b/story", "http://example.com/a;b/story"),
     
     # Test fragment removal
-    assert canonicalize_url("http://example.com#section") == "http://example.com"
+    ("http://example.com#section", "http://example.com"),
     
     # Test combined case
-    assert canonicalize_url("HTTP://WWW.EXAMPLE.COM/page/?utm_source=test#section") == "http://example.com/page" 
\ No newline at end of file
+    ("HTTP://WWW.EXAMPLE.COM/page/?utm_source=test#section", "http://example.com/page"),
+]
+
+@pytest.mark.parametrize("url,expected", CANONICALIZE_CASES)
+def test_canonicalize_url(url, expected):
+    """Test URL canonicalization."""
+    assert canonicalize_url(url) == expected
@@ -0,0 +1,49 @@
+"""Tests for source processing."""
+import asyncio
+
+import pytest
+
+import config
+from headline_worker.modules import source_processor
+
+@pytest.mark.parametrize("outcomes", [
+    ["processed"],
+    ["processed", "skipped", "error", None],
+])
+def test_process_source_respects_limit(monkeypatch, outcomes):
+    """Articles started never exceed the limit, counting articles still in flight."""
+    limit = 15
+    links = [f"https://example.com/news/story-{i}" for i in range(30)]
+    started = []
+    counted = []
+    in_flight = []
+    peak = []
+    
+    async def fake_process_article_url(article_url, source_id, processed_urls):
+        started.append(article_url)
+        in_flight.append(article_url)
+        peak.append(len(counted) + len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(article_url)
+        outcome = outcomes[len(started) % len(outcomes)]
+        if outcome in ("processed", "skipped"):
+            counted.append(article_url)
+        return outcome
+    
+    async def fake_collect_links(url, limit):
+        return links
+    
+    async def fake_lookup_processed_urls(urls):
+        return {}
+    
+    monkeypatch.setattr(config, "MAX_CONCURRENT_ARTICLES", 8)
+    monkeypatch.setattr(source_processor, "get_source_by_id", lambda source_id, table: {"url": "https://example.com"})
+    monkeypatch.setattr(source_processor, "collect_links", fake_collect_links)
+    monkeypatch.setattr(source_processor, "_lookup_processed_urls", fake_lookup_processed_urls)
+    monkeypatch.setattr(source_processor, "_process_article_url", fake_process_article_url)
+    
+    asyncio.run(source_processor.process_source(None, {"source_id": 1, "source_table": "sources", "limit": limit}))
+    
+    # Articles already counted plus those running never exceeded the limit
+    assert max(peak) <= limit
+    assert len(counted) == limit